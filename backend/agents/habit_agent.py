@@ -8,11 +8,12 @@ based on the conversation context and keeps the multi-agent workflow
 going after crisis/resource handling.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from loguru import logger
 
 from .base_agent import BaseAgent, AgentState
+from .keyword_scanner import KeywordScanner
 
 
 class HabitAgent(BaseAgent):
@@ -24,6 +25,13 @@ class HabitAgent(BaseAgent):
     LLM calls.
     """
 
+    __slots__ = ()
+
+    # process() never calls the LLM - the plan is fully deterministic -
+    # so skip client construction entirely. get_system_prompt stays for
+    # future expansion; the llm property would still lazy-init if used.
+    _needs_llm = False
+
     KEYWORD_LIBRARY: Dict[str, Dict[str, str]] = {
         "burnout": {
             "title": "End-of-day decompress",
@@ -47,6 +55,27 @@ class HabitAgent(BaseAgent):
         },
     }
 
+    # One automaton scan of the context replaces a substring test per
+    # library keyword; "default" is a sentinel, not a keyword to match.
+    _PLAN_SCANNER = KeywordScanner({
+        keyword: [keyword]
+        for keyword in KEYWORD_LIBRARY
+        if keyword != "default"
+    })
+
+    # Scannable entries precomputed once - no per-call "default" compare
+    _SCAN_ITEMS: Tuple[Tuple[str, Dict[str, str]], ...] = tuple(
+        (keyword, habit)
+        for keyword, habit in KEYWORD_LIBRARY.items()
+        if keyword != "default"
+    )
+
+    # No-match plan, precomputed: reflection checkpoint + win tracker
+    _FALLBACK: Tuple[Dict[str, str], ...] = (
+        KEYWORD_LIBRARY["purpose"],
+        KEYWORD_LIBRARY["default"],
+    )
+
     def __init__(self):
         super().__init__(
             agent_name="Habit Agent",
@@ -98,6 +127,12 @@ class HabitAgent(BaseAgent):
         Combine recent human messages for lightweight context.
         """
 
+        # add_message keeps a running lowercased concatenation of user
+        # messages; reuse it instead of re-scanning the history
+        cached = state.agent_data.get("_user_text_lower")
+        if cached is not None:
+            return cached
+
         user_messages = [
             getattr(message, "content", "")
             for message in state.messages
@@ -110,18 +145,20 @@ class HabitAgent(BaseAgent):
         Simple keyword-based habit suggestions.
         """
 
+        # Single pass over the context; library insertion order decides
+        # which habits surface first, matching the old loop's behavior.
+        hit_keywords = self._PLAN_SCANNER.hit_groups(context)
+        if not hit_keywords:
+            return list(self._FALLBACK)
+
         matches: List[Dict[str, str]] = []
-        for keyword, habit in self.KEYWORD_LIBRARY.items():
-            if keyword == "default":
-                continue
-            if keyword in context:
+        for keyword, habit in self._SCAN_ITEMS:
+            if keyword in hit_keywords:
                 matches.append(habit)
+                if len(matches) == 3:
+                    # Three matched habits fill the plan outright
+                    break
 
-        if not matches:
-            matches.append(self.KEYWORD_LIBRARY["purpose"])
-            matches.append(self.KEYWORD_LIBRARY["default"])
-        else:
+        if len(matches) < 3:
             matches.append(self.KEYWORD_LIBRARY["default"])
-
-        # Guarantee at most three habits to keep output digestible.
-        return matches[:3]
+        return matches
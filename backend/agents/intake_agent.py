@@ -21,11 +21,12 @@ KEY PRINCIPLES:
 - Human-like conversation flow
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, ClassVar
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from loguru import logger
 
 from .base_agent import BaseAgent, AgentState
+from .keyword_scanner import KeywordScanner
 
 
 class IntakeAgent(BaseAgent):
@@ -42,6 +43,8 @@ class IntakeAgent(BaseAgent):
     - Build trust before any assessment
     """
 
+    __slots__ = ("_system_message",)
+
     # Conversation stages (tracked in agent_data)
     STAGE_GREETING = "greeting"
     STAGE_CHECK_IN = "check_in"
@@ -50,18 +53,61 @@ class IntakeAgent(BaseAgent):
     STAGE_GATHER_CONTEXT = "gather_context"
     STAGE_READY_FOR_ASSESSMENT = "ready_for_assessment"
 
-    EMOTION_KEYWORDS = {
+    # Immutable keyword tables - frozenset signals these are build-time
+    # constants (safe to hash/share, e.g. as lru_cache keys)
+    EMOTION_KEYWORDS: ClassVar[frozenset] = frozenset({
         "stressed", "anxious", "anxiety", "overwhelmed", "lost", "hopeless",
         "sad", "down", "tired", "burned", "burnt", "exhausted", "mess"
-    }
-    SUPPORT_KEYWORDS = {
+    })
+    SUPPORT_KEYWORDS: ClassVar[frozenset] = frozenset({
         "help", "support", "talk", "therapy", "therapist", "someone", "guidance",
         "volunteer", "counselor", "listen"
-    }
-    CRISIS_KEYWORDS = {
+    })
+    CRISIS_KEYWORDS: ClassVar[frozenset] = frozenset({
         "kill myself", "end it all", "suicide", "hurt myself", "hang myself",
         "take my life", "die", "overdose", "can't go on", "no reason to live",
         "want to end everything"
+    })
+
+    # Single-pass scanners built once at class creation. One scan of the
+    # text replaces a Python-level `any(kw in text ...)` loop per bucket.
+    _CONTEXT_SCANNER = KeywordScanner({
+        "emotion": EMOTION_KEYWORDS,
+        "support": SUPPORT_KEYWORDS,
+    })
+    _CRISIS_SCANNER = KeywordScanner({"crisis": CRISIS_KEYWORDS})
+
+    # Static stage-guidance table. Pure data - built once at class
+    # creation instead of re-allocating the dict on every turn.
+    _STAGE_GUIDANCE: Dict[str, str] = {
+        STAGE_GREETING: (
+            "Open with a heartfelt welcome and a short invitation to share. "
+            "Keep it to one or two sentences, warm and human."
+        ),
+        STAGE_CHECK_IN: (
+            "They responded. Reflect their tone briefly and ask how they’re feeling today. "
+            "Make it sound like a caring friend—no formal language."
+        ),
+        STAGE_WHAT_BRINGS_YOU: (
+            "They’ve shared a bit. Acknowledge what you heard and ask what brought them here. "
+            "Stay gentle, under three sentences."
+        ),
+        STAGE_EXPLORE_TROUBLE: (
+            "They described something tough. Offer validation in your own words and ask what’s been most challenging recently."
+        ),
+        STAGE_GATHER_CONTEXT: (
+            "Keep the conversation flowing—mirror what you’ve heard and ask one follow-up to understand their situation better."
+        ),
+        STAGE_READY_FOR_ASSESSMENT: (
+            "They’ve opened up a lot. Thank them, reflect the core of what they shared, and gently offer to connect them with a volunteer therapist at no cost—ask if that feels helpful right now."
+        ),
+    }
+
+    # Each guidance string pre-wrapped in a SystemMessage so process()
+    # appends a shared instance instead of constructing one per turn
+    _STAGE_MESSAGES: Dict[str, SystemMessage] = {
+        stage: SystemMessage(content=text)
+        for stage, text in _STAGE_GUIDANCE.items()
     }
 
     def __init__(self):
@@ -71,6 +117,10 @@ class IntakeAgent(BaseAgent):
             max_tokens=300    # Shorter responses, more conversational
         )
 
+        # The prompt is a constant - wrap it in a SystemMessage once and
+        # reuse the instance instead of re-allocating it every turn
+        self._system_message = SystemMessage(content=self.get_system_prompt())
+
         logger.info("🤝 Intake Agent initialized - Ready to provide warm welcome")
 
     def get_system_prompt(self) -> str:
@@ -102,42 +152,97 @@ Guidelines:
         # Detect immediate crisis cues before proceeding with standard flow
         last_user_message = self._get_last_user_message(state)
         if last_user_message and self._contains_immediate_risk(last_user_message.content):
-            logger.warning("🚨 Emergency language detected during intake")
-            emergency_reply = (
-                "Thank you for trusting me with that. Your safety matters more than anything right now. "
-                "If you can, please call or text 988 (Suicide & Crisis Lifeline) or dial 911 immediately. "
-                "I’m bringing in our crisis specialist so you don’t have to face this alone."
-            )
-            state = self.add_message(state, "assistant", emergency_reply)
-            state.agent_data["intake_stage"] = self.STAGE_READY_FOR_ASSESSMENT
-            state.agent_data["intake_complete"] = True
-            state.agent_data["force_crisis"] = True
-            state.agent_data["skip_privacy_prompt"] = True
-            self.log_decision(
-                "intake_emergency_detected",
-                {"trigger_message": last_user_message.content}
-            )
-            return state
+            return self._handle_emergency(state, last_user_message)
+
+        messages = self._build_messages(state, current_stage)
+
+        # Generate response
+        logger.debug("🤖 Generating warm response...")
+        response = await self.llm.ainvoke(messages)
+
+        reply_text = self._extract_reply(response.content)
+
+        return self._finalize_turn(state, current_stage, reply_text)
+
+    async def process_stream(self, state: AgentState) -> AsyncIterator[str]:
+        """
+        Streaming variant of process() - yields reply text as it is
+        generated so callers can start rendering at the first token
+        instead of waiting for the full completion.
+
+        Mutates `state` in place; by the time the iterator is exhausted,
+        the assistant message and stage bookkeeping are finalized exactly
+        as process() would have left them.
+        """
+
+        logger.info("🤝 Starting intake conversation (streaming)...")
+
+        current_stage = state.agent_data.get("intake_stage", self.STAGE_GREETING)
+
+        # Emergency replies are canned - yield them in one piece
+        last_user_message = self._get_last_user_message(state)
+        if last_user_message and self._contains_immediate_risk(last_user_message.content):
+            self._handle_emergency(state, last_user_message)
+            yield state.messages[-1].content
+            return
+
+        messages = self._build_messages(state, current_stage)
+
+        logger.debug("🤖 Streaming warm response...")
+        chunks: list = []
+        async for piece in self.stream_llm(messages):
+            chunks.append(piece)
+            yield piece
+
+        reply_text = self._extract_reply("".join(chunks))
+        self._finalize_turn(state, current_stage, reply_text)
+
+    def _build_messages(self, state: AgentState, current_stage: str) -> list:
+        """Assemble system prompt + stage guidance + history for the LLM."""
 
-        # Get conversation history
         messages: list = []
 
         # Add system prompt (true system instruction)
-        messages.append(SystemMessage(content=self.get_system_prompt()))
-
-        # Add stage-specific guidance as system context
-        stage_guidance = self._get_stage_guidance(current_stage, state)
-        if stage_guidance:
-            messages.append(SystemMessage(content=stage_guidance))
+        messages.append(self._system_message)
+
+        # Add stage-specific guidance as system context (pre-wrapped).
+        # Only on the FIRST turn of a stage - repeating identical
+        # guidance on consecutive turns just pads the payload, and the
+        # shorter stable prefix caches better provider-side. Later turns
+        # at the same stage lean on the conversational continuity the
+        # first guided reply established.
+        stage_message = self._STAGE_MESSAGES.get(current_stage)
+        if stage_message and state.agent_data.get("_last_guidance_stage") != current_stage:
+            messages.append(stage_message)
+            state.agent_data["_last_guidance_stage"] = current_stage
 
         # Add conversation history after guidance
         messages.extend(state.messages)
 
-        # Generate response
-        logger.debug("🤖 Generating warm response...")
-        response = await self.llm.ainvoke(messages)
+        return messages
 
-        reply_text = self._extract_reply(response.content)
+    def _handle_emergency(self, state: AgentState, last_user_message: BaseMessage) -> AgentState:
+        """Short-circuit intake when emergency language is detected."""
+
+        logger.warning("🚨 Emergency language detected during intake")
+        emergency_reply = (
+            "Thank you for trusting me with that. Your safety matters more than anything right now. "
+            "If you can, please call or text 988 (Suicide & Crisis Lifeline) or dial 911 immediately. "
+            "I’m bringing in our crisis specialist so you don’t have to face this alone."
+        )
+        state = self.add_message(state, "assistant", emergency_reply)
+        state.agent_data["intake_stage"] = self.STAGE_READY_FOR_ASSESSMENT
+        state.agent_data["intake_complete"] = True
+        state.agent_data["force_crisis"] = True
+        state.agent_data["skip_privacy_prompt"] = True
+        self.log_decision(
+            "intake_emergency_detected",
+            {"trigger_message": last_user_message.content}
+        )
+        return state
+
+    def _finalize_turn(self, state: AgentState, current_stage: str, reply_text: str) -> AgentState:
+        """Record the reply and advance the stage machine."""
 
         # Add response to state
         state = self.add_message(state, "assistant", reply_text)
@@ -183,31 +288,7 @@ Guidelines:
         This is NOT shown to user - it guides the LLM's response.
         """
 
-        guidance = {
-            self.STAGE_GREETING: (
-                "Open with a heartfelt welcome and a short invitation to share. "
-                "Keep it to one or two sentences, warm and human."
-            ),
-            self.STAGE_CHECK_IN: (
-                "They responded. Reflect their tone briefly and ask how they’re feeling today. "
-                "Make it sound like a caring friend—no formal language."
-            ),
-            self.STAGE_WHAT_BRINGS_YOU: (
-                "They’ve shared a bit. Acknowledge what you heard and ask what brought them here. "
-                "Stay gentle, under three sentences."
-            ),
-            self.STAGE_EXPLORE_TROUBLE: (
-                "They described something tough. Offer validation in your own words and ask what’s been most challenging recently."
-            ),
-            self.STAGE_GATHER_CONTEXT: (
-                "Keep the conversation flowing—mirror what you’ve heard and ask one follow-up to understand their situation better."
-            ),
-            self.STAGE_READY_FOR_ASSESSMENT: (
-                "They’ve opened up a lot. Thank them, reflect the core of what they shared, and gently offer to connect them with a volunteer therapist at no cost—ask if that feels helpful right now."
-            ),
-        }
-
-        return guidance.get(stage)
+        return self._STAGE_GUIDANCE.get(stage)
 
     def _determine_next_stage(self, current_stage: str, state: AgentState) -> str:
         """
@@ -217,13 +298,14 @@ Guidelines:
         moves to next stage appropriately.
         """
 
-        # Count meaningful user messages (not just greetings)
-        user_messages = [
-            msg for msg in state.messages
-            if hasattr(msg, 'type') and msg.type == 'human'
-        ]
-
-        num_exchanges = len(user_messages)
+        # Count meaningful user messages (not just greetings) - use the
+        # counter add_message maintains instead of re-filtering history
+        num_exchanges = state.agent_data.get("_user_msg_count")
+        if num_exchanges is None:
+            num_exchanges = sum(
+                1 for msg in state.messages
+                if hasattr(msg, 'type') and msg.type == 'human'
+            )
 
         # Faster progression - complete after 4-5 turns
         if current_stage == self.STAGE_GREETING and num_exchanges >= 1:
@@ -245,7 +327,8 @@ Guidelines:
             return self.STAGE_GATHER_CONTEXT
 
         elif current_stage == self.STAGE_GATHER_CONTEXT:
-            last_user_msg = user_messages[-1].content if user_messages else ""
+            last_user = self._get_last_user_message(state)
+            last_user_msg = last_user.content if last_user else ""
             if num_exchanges >= 5 and len(last_user_msg.split()) >= 6:
                 return self.STAGE_READY_FOR_ASSESSMENT
             return current_stage
@@ -269,11 +352,14 @@ Guidelines:
         This summarizes what we learned about the user's situation.
         """
 
-        # Get all user messages
-        user_messages = [
-            msg.content for msg in state.messages
-            if hasattr(msg, 'type') and msg.type == 'human'
-        ]
+        # Get all user messages (cached by add_message, with a scan
+        # fallback for externally-populated histories)
+        user_messages = state.agent_data.get("_user_contents")
+        if user_messages is None:
+            user_messages = [
+                msg.content for msg in state.messages
+                if hasattr(msg, 'type') and msg.type == 'human'
+            ]
 
         # Combine into context summary
         context = "\n".join([f"User: {msg}" for msg in user_messages])
@@ -285,30 +371,44 @@ Guidelines:
         Confirm intake gathered enough meaningful information before escalation.
         """
 
-        user_messages = [
-            msg.content for msg in state.messages
-            if hasattr(msg, 'type') and msg.type == 'human'
-        ]
-
         if state.agent_data.get("force_crisis"):
             return True
 
-        if len(user_messages) < 4:
-            return False
-
-        recent_text = " ".join(user_messages[-4:]).lower()
-
-        has_emotion = any(keyword in recent_text for keyword in self.EMOTION_KEYWORDS)
-        has_support_request = any(keyword in recent_text for keyword in self.SUPPORT_KEYWORDS)
-        word_count = len(recent_text.split())
-
-        return has_emotion and has_support_request and word_count >= 35
+        # Prefer the incremental caches maintained by add_message over
+        # re-filtering and re-lowering the whole history each turn
+        recent = state.agent_data.get("_user_msgs_recent")
+        if recent is not None:
+            if state.agent_data.get("_user_msg_count", 0) < 4:
+                return False
+            recent_text = " ".join(recent)
+        else:
+            # History was populated outside add_message - fall back to a scan
+            user_messages = [
+                msg.content for msg in state.messages
+                if hasattr(msg, 'type') and msg.type == 'human'
+            ]
+            if len(user_messages) < 4:
+                return False
+            recent_text = " ".join(user_messages[-4:]).lower()
+
+        # Both bucket checks come from one scan of the text
+        hits = self._CONTEXT_SCANNER.hit_groups(recent_text)
+        # Count separators instead of allocating a list via .split()
+        word_count = recent_text.count(" ") + 1
+
+        return "emotion" in hits and "support" in hits and word_count >= 35
 
     def _get_last_user_message(self, state: AgentState) -> Optional[BaseMessage]:
         """
         Return the most recent human message, if any.
         """
 
+        # add_message tracks the newest human message; O(1) lookup
+        last = state.agent_data.get("_last_user_msg")
+        if last is not None:
+            return last
+
+        # Fallback for histories populated outside add_message
         for message in reversed(state.messages):
             if getattr(message, "type", "") == "human":
                 return message
@@ -320,7 +420,7 @@ Guidelines:
         """
 
         lowered = (text or "").lower()
-        return any(keyword in lowered for keyword in self.CRISIS_KEYWORDS)
+        return self._CRISIS_SCANNER.contains_any(lowered)
 
 
 # Convenience function for testing
@@ -0,0 +1,176 @@
+"""
+Keyword Scanner - Single-Pass Multi-Pattern Matching
+=====================================================
+
+Several agents (Crisis, Coordinator, Intake) screen user messages
+against keyword lists. Doing that with nested
+`for keyword in list: if keyword in message` loops scans the message
+once per keyword - O(K·N) work on every turn.
+
+This module provides a shared scanner that finds ALL keyword hits in
+ONE linear pass over the message:
+
+1. Preferred: an Aho-Corasick automaton (`pyahocorasick`), the classic
+   multi-pattern DFA - 10-50x faster than repeated substring scans.
+2. Fallback: a single compiled regex alternation, still one pass over
+   the string using the C regex engine instead of Python-level loops.
+
+Scanners are built once (at module import in the agents) so tool
+invocations never rebuild them.
+
+PERFORMANCE NOTE: a Numba-compiled byte-level scan kernel was
+considered as a third engine, but both paths above already execute in
+C (the automaton is a C extension, `finditer` is the C regex engine),
+and messages are short chat turns - JIT compile/import overhead would
+dwarf any win. Revisit only if scanning moves to bulk offline corpora.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    # pyahocorasick is a C extension; fall back to compiled regex if
+    # it isn't installed so the agents keep working everywhere.
+    _HAS_AHOCORASICK = False
+
+
+class KeywordScanner:
+    """
+    Scans text for grouped keywords in a single pass.
+
+    Groups are ranked by their order in `rank_order` (lowest priority
+    first), mirroring how the agents escalate: a single scan reports
+    the highest-priority group that matched plus its keywords.
+
+    Example:
+        scanner = KeywordScanner(CRISIS_KEYWORDS, rank_order=["low", "high"])
+        group, hits = scanner.best_group("feeling hopeless and stressed")
+    """
+
+    def __init__(
+        self,
+        keyword_groups: Dict[str, List[str]],
+        rank_order: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            keyword_groups: Mapping of group name → keyword list
+                           (e.g., {"immediate": [...], "high": [...]})
+            rank_order: Group names from lowest to highest priority.
+                       Defaults to insertion order of keyword_groups.
+        """
+
+        order = rank_order or list(keyword_groups.keys())
+        self._rank_of = {group: rank for rank, group in enumerate(order)}
+        self._top_rank = len(order) - 1
+
+        # Keyword → (rank, group). If a keyword appears in several
+        # groups, the highest-priority group wins.
+        self._payloads: Dict[str, Tuple[int, str]] = {}
+        for group, keywords in keyword_groups.items():
+            rank = self._rank_of[group]
+            for keyword in keywords:
+                existing = self._payloads.get(keyword)
+                if existing is None or rank > existing[0]:
+                    self._payloads[keyword] = (rank, group)
+
+        if _HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, payload in self._payloads.items():
+                self._automaton.add_word(keyword, (*payload, keyword))
+            self._automaton.make_automaton()
+            self._pattern = None
+        else:
+            # Longest-first alternation so multi-word phrases win over
+            # any single-word prefix at the same position.
+            self._automaton = None
+            self._pattern = re.compile(
+                "|".join(
+                    re.escape(keyword)
+                    for keyword in sorted(self._payloads, key=len, reverse=True)
+                )
+            )
+
+    def _iter_hits(self, text: str):
+        """Yield (rank, group, keyword) for each match, lazily."""
+
+        if self._automaton is not None:
+            for _end, payload in self._automaton.iter(text):
+                yield payload
+        else:
+            for match in self._pattern.finditer(text):
+                yield (*self._payloads[match.group(0)], match.group(0))
+
+    def scan(self, text: str) -> List[Tuple[int, str, str]]:
+        """
+        Find every keyword hit in one pass.
+
+        Args:
+            text: Lowercased message text to scan
+
+        Returns:
+            List of (rank, group, keyword) for each match found.
+        """
+
+        return list(self._iter_hits(text))
+
+    def best_group(
+        self,
+        text: str,
+        early_stop: bool = False,
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Return the highest-priority group that matched and its keywords.
+
+        Args:
+            text: Lowercased message text to scan
+            early_stop: Stop scanning as soon as a top-rank keyword is
+                       seen - nothing can outrank it, so callers that
+                       only need the level can skip the rest of the
+                       message (keywords_found may then be partial).
+
+        Returns:
+            (group_name, keywords_found) - (None, []) when nothing matched.
+        """
+
+        best_rank = -1
+        best_group: Optional[str] = None
+        hits_by_rank: Dict[int, List[str]] = {}
+
+        for rank, group, keyword in self._iter_hits(text):
+            hits_by_rank.setdefault(rank, []).append(keyword)
+            if rank > best_rank:
+                best_rank = rank
+                best_group = group
+            if early_stop and best_rank == self._top_rank:
+                break
+
+        if best_group is None:
+            return None, []
+
+        # Preserve legacy behavior: only report keywords from the
+        # detected (highest) level, de-duplicated in match order.
+        return best_group, list(dict.fromkeys(hits_by_rank[best_rank]))
+
+    def hit_groups(self, text: str) -> set:
+        """
+        Return the set of group names with at least one hit.
+
+        One linear pass replaces a separate `any(kw in text ...)` loop
+        per group for callers that need several yes/no group checks.
+        """
+
+        return {group for _rank, group, _keyword in self._iter_hits(text)}
+
+    def contains_any(self, text: str) -> bool:
+        """True if any keyword appears in the text (single pass, early exit)."""
+
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+
+        return self._pattern.search(text) is not None
@@ -27,107 +27,217 @@ This is the GOLDEN DEMO for the hackathon presentation!
 """
 
 import asyncio
-from workflows.crisis_to_resource import run_crisis_resource_workflow
-from models.mock_data import therapist_db
+import contextvars
+import io
+import os
+import sys
 from loguru import logger
 
+# The workflow module drags in the whole LangGraph/Nemotron stack and
+# mock_data builds the therapist database at import - both are deferred
+# to first use so `--help`-style invocations and plain imports of this
+# module stay cheap. Python caches modules, so the repeated in-function
+# imports below are dictionary lookups after the first call.
+
 # Make output more visually appealing for demo
 logger.remove()
 logger.add(
-    lambda msg: print(msg, end=""),
+    # One direct write per record - print() would re-acquire the stdout
+    # lock and flush for every log line
+    lambda msg: sys.stdout.write(str(msg)),
     format="<level>{message}</level>",
     colorize=True
 )
 
+# --fast skips the staged demo pauses (useful for CI and rehearsals)
+FAST_MODE = "--fast" in sys.argv
+
+# Single pacing knob for every inter-scenario pause. The pauses exist
+# purely for human presentation rhythm, so CI sets DEMO_PAUSE=0 (or
+# passes --fast) and pays zero wall time for them.
+DEMO_PAUSE = 0.0 if FAST_MODE else float(os.getenv("DEMO_PAUSE", "2"))
+
+# Risk level -> display emoji, built once instead of per summary call
+_RISK_EMOJI = {
+    'none': '🟢',
+    'low': '🟡',
+    'moderate': '🟠',
+    'high': '🔴',
+    'immediate': '🚨'
+}
+
+# Scenarios now run concurrently, so each one writes into a task-local
+# transcript instead of straight to the terminal - otherwise their
+# output would interleave line-by-line as the event loop switches
+# between them. The buffer is flushed as one block when the scenario
+# finishes. asyncio tasks each get their own contextvar copy, so this
+# dispatch is safe across concurrent coroutines.
+_STDOUT_BUFFER: contextvars.ContextVar = contextvars.ContextVar(
+    "demo_stdout_buffer", default=None
+)
+_REAL_STDOUT = sys.stdout
+
+
+class _TaskLocalStdout:
+    """Route writes to the current task's transcript buffer, if any."""
+
+    def write(self, text: str) -> int:
+        buffer = _STDOUT_BUFFER.get()
+        return (buffer if buffer is not None else _REAL_STDOUT).write(text)
+
+    def flush(self) -> None:
+        buffer = _STDOUT_BUFFER.get()
+        (buffer if buffer is not None else _REAL_STDOUT).flush()
+
+
+sys.stdout = _TaskLocalStdout()
+
+
+async def _run_buffered(scenario) -> None:
+    """Run a scenario coroutine with its output captured and flushed atomically."""
+
+    buffer = io.StringIO()
+    token = _STDOUT_BUFFER.set(buffer)
+    try:
+        await scenario()
+    finally:
+        _STDOUT_BUFFER.reset(token)
+        _REAL_STDOUT.write(buffer.getvalue())
+        _REAL_STDOUT.flush()
+
+
+async def _demo_pause() -> None:
+    """Dramatic pause between demo beats; zero-cost when DEMO_PAUSE=0."""
+
+    if DEMO_PAUSE:
+        await asyncio.sleep(DEMO_PAUSE)
+
+
+# Coalescing workflow cache for demo/test replays: the result of a
+# (message, tier) run is deterministic enough for demo purposes, and
+# caching the *Future* (not the result) means concurrent callers of an
+# identical run share one in-flight workflow instead of each paying
+# the full chain of LLM calls. FIFO-capped; dicts preserve insertion
+# order so the oldest key is first.
+_WORKFLOW_CACHE: dict = {}
+_WORKFLOW_CACHE_MAX = 128
+
+
+def _run_workflow_cached(user_message: str, user_id: str, privacy_tier: str):
+    """Run the workflow, coalescing identical (message, tier) invocations."""
+
+    from workflows.crisis_to_resource import run_crisis_resource_workflow
+
+    key = (user_message, privacy_tier)
+    future = _WORKFLOW_CACHE.get(key)
+    if future is None:
+        if len(_WORKFLOW_CACHE) >= _WORKFLOW_CACHE_MAX:
+            _WORKFLOW_CACHE.pop(next(iter(_WORKFLOW_CACHE)))
+        future = asyncio.ensure_future(run_crisis_resource_workflow(
+            user_message=user_message,
+            user_id=user_id,
+            privacy_tier=privacy_tier
+        ))
+        _WORKFLOW_CACHE[key] = future
+    return future
+
 
 def print_section_header(title: str, emoji: str = "🎯"):
     """Print a visually appealing section header."""
-    print("\n")
-    print("=" * 80)
-    print(f"{emoji}  {title}")
-    print("=" * 80)
-    print()
+    # One buffered write per section - dozens of individual print()
+    # calls each take the stdout lock and flush, which dominates
+    # latency on slow terminals and captured pipes
+    sys.stdout.write(
+        "\n\n"
+        + "=" * 80 + "\n"
+        + f"{emoji}  {title}\n"
+        + "=" * 80 + "\n\n"
+    )
 
 
 def print_scenario_header(number: int, title: str, description: str):
     """Print scenario header with details."""
-    print("\n")
-    print("█" * 80)
-    print(f"📋 SCENARIO {number}: {title}")
-    print("─" * 80)
-    print(f"   {description}")
-    print("█" * 80)
-    print()
+    sys.stdout.write(
+        "\n\n"
+        + "█" * 80 + "\n"
+        + f"📋 SCENARIO {number}: {title}\n"
+        + "─" * 80 + "\n"
+        + f"   {description}\n"
+        + "█" * 80 + "\n\n"
+    )
 
 
 def print_db_stats():
     """Display current database statistics."""
+    from models.mock_data import therapist_db
+
     stats = therapist_db.get_statistics()
-    print("📊 Current Database Status:")
-    print(f"   • Total Therapists: {stats['total_therapists']}")
-    print(f"   • Active: {stats['active']}")
-    print(f"   • Available: {stats['available']}")
-    print(f"   • Full: {stats['full']}")
-    print(f"   • Utilization: {stats['utilization_rate']:.1f}%")
-    print()
+    sys.stdout.write(
+        "📊 Current Database Status:\n"
+        f"   • Total Therapists: {stats['total_therapists']}\n"
+        f"   • Active: {stats['active']}\n"
+        f"   • Available: {stats['available']}\n"
+        f"   • Full: {stats['full']}\n"
+        f"   • Utilization: {stats['utilization_rate']:.1f}%\n\n"
+    )
 
 
-def print_result_summary(result: dict):
+def print_result_summary(result):
     """Display workflow result in a clean format."""
-    print("\n" + "─" * 80)
-    print("📊 WORKFLOW RESULT SUMMARY")
-    print("─" * 80)
+    lines = [
+        "\n" + "─" * 80,
+        "📊 WORKFLOW RESULT SUMMARY",
+        "─" * 80,
+    ]
 
     # Messages exchanged
-    print(f"💬 Messages Exchanged: {len(result.get('messages', []))}")
+    lines.append(f"💬 Messages Exchanged: {len(result.messages)}")
 
     # Risk assessment
-    risk_level = result.get('risk_level', 'unknown')
-    risk_emoji = {
-        'none': '🟢',
-        'low': '🟡',
-        'moderate': '🟠',
-        'high': '🔴',
-        'immediate': '🚨'
-    }.get(risk_level, '❓')
-    print(f"{risk_emoji} Risk Level: {risk_level.upper()}")
+    risk_level = result.risk_level
+    risk_emoji = _RISK_EMOJI.get(risk_level, '❓')
+    lines.append(f"{risk_emoji} Risk Level: {risk_level.upper()}")
 
     # Crisis detection
-    crisis_detected = result.get('crisis_detected', False)
+    crisis_detected = result.crisis_detected
     crisis_icon = "🚨 YES" if crisis_detected else "✅ NO"
-    print(f"   Crisis Detected: {crisis_icon}")
+    lines.append(f"   Crisis Detected: {crisis_icon}")
 
     # Coordinator plan
-    coordinator_plan = result.get('coordinator_plan') or []
+    coordinator_plan = result.coordinator_plan
     if coordinator_plan:
-        print("\n🧭 Coordinator Plan:")
+        lines.append("\n🧭 Coordinator Plan:")
         for step in coordinator_plan:
-            print(f"   • {step}")
+            lines.append(f"   • {step}")
 
     # Therapist matching
-    therapist_matched = result.get('therapist_matched', False)
+    therapist_matched = result.therapist_matched
     if therapist_matched:
-        therapist_name = result.get('matched_therapist_name', 'Unknown')
-        print(f"👨‍⚕️  Therapist Match: ✅ YES")
-        print(f"   Matched with: {therapist_name}")
+        therapist_name = result.matched_therapist_name or 'Unknown'
+        lines.append(f"👨‍⚕️  Therapist Match: ✅ YES")
+        lines.append(f"   Matched with: {therapist_name}")
     else:
-        print(f"👨‍⚕️  Therapist Match: ⏸️  NO (Support resources provided)")
+        lines.append(f"👨‍⚕️  Therapist Match: ⏸️  NO (Support resources provided)")
 
     # Habit follow-through
-    habit_plan = result.get('habit_plan') or []
+    habit_plan = result.habit_plan
     if habit_plan:
-        print("\n📈 Habit Agent Follow-Up:")
+        lines.append("\n📈 Habit Agent Follow-Up:")
         for item in habit_plan:
-            print(f"   • {item['title']}: {item['description']}")
+            lines.append(f"   • {item['title']}: {item['description']}")
 
-    print("─" * 80)
+    lines.append("─" * 80)
 
     # Show final message
-    if result.get('messages'):
-        final_message = result['messages'][-1].content
-        print("\n🤖 Final Response Preview:")
-        print("   " + final_message[:200] + "..." if len(final_message) > 200 else "   " + final_message)
-        print()
+    if result.messages:
+        final_message = result.messages[-1].content
+        lines.append("\n🤖 Final Response Preview:")
+        preview = final_message[:200]
+        suffix = "..." if len(final_message) > 200 else ""
+        lines.append("   " + preview + suffix)
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def scenario_1_high_risk_crisis():
@@ -165,7 +275,7 @@ async def scenario_1_high_risk_crisis():
     print("🔄 Starting Multi-Agent Workflow...")
     print()
 
-    result = await run_crisis_resource_workflow(
+    result = await _run_workflow_cached(
         user_message=user_message,
         user_id="demo_user_1",
         privacy_tier="full_support"
@@ -175,8 +285,8 @@ async def scenario_1_high_risk_crisis():
     print_result_summary(result)
 
     # Validate expected behavior
-    assert result['crisis_detected'], "Should detect crisis"
-    assert result['risk_level'] in ['high', 'immediate'], "Should be high risk"
+    assert result.crisis_detected, "Should detect crisis"
+    assert result.risk_level in ['high', 'immediate'], "Should be high risk"
     # Note: therapist_matched might be False if Resource Agent provides alternatives
 
     print("✅ SCENARIO 1 COMPLETE: High-risk crisis properly detected and routed\n")
@@ -214,7 +324,7 @@ async def scenario_2_low_risk_support():
     print("🔄 Starting Multi-Agent Workflow...")
     print()
 
-    result = await run_crisis_resource_workflow(
+    result = await _run_workflow_cached(
         user_message=user_message,
         user_id="demo_user_2",
         privacy_tier="full_support"
@@ -244,16 +354,19 @@ async def scenario_3_autonomous_search():
     THIS IS THE MOST IMPRESSIVE PART!
     """
 
+    from models.mock_data import therapist_db
+    from workflows.crisis_to_resource import run_crisis_resource_workflow
+
     print_scenario_header(
         3,
         "Autonomous Therapist Search & Onboarding",
         "Empty database → Agent autonomously searches → Onboards therapists → Match!"
     )
 
-    # Save original database
+    # Save original database - pointer swap, no list copy, and the
+    # swap keeps the database's lookup indexes in sync
     print("🗄️  Temporarily clearing database to simulate empty state...")
-    original_therapists = therapist_db.therapists.copy()
-    therapist_db.therapists = []
+    original_therapists = therapist_db.replace_all([])
 
     print_db_stats()
     print("⚠️  NO THERAPISTS AVAILABLE - Watch the agent work autonomously!")
@@ -282,35 +395,38 @@ async def scenario_3_autonomous_search():
     print("   6️⃣  Agent completes the match")
     print()
 
-    result = await run_crisis_resource_workflow(
-        user_message=user_message,
-        user_id="demo_user_3",
-        privacy_tier="full_support"
-    )
-
-    # Display results
-    print_result_summary(result)
+    try:
+        result = await run_crisis_resource_workflow(
+            user_message=user_message,
+            user_id="demo_user_3",
+            privacy_tier="full_support"
+        )
 
-    # Check if database was populated
-    print("\n📊 Database After Autonomous Action:")
-    new_stats = therapist_db.get_statistics()
-    print(f"   • Total Therapists: {new_stats['total_therapists']}")
-    print(f"   • Available: {new_stats['available']}")
-    print()
+        # Display results
+        print_result_summary(result)
 
-    if new_stats['total_therapists'] > 0:
-        print("🎉 AUTONOMY DEMONSTRATED!")
-        print("   The agent autonomously:")
-        print("   ✅ Detected problem (empty database)")
-        print("   ✅ Decided to search for solution")
-        print("   ✅ Executed web search")
-        print("   ✅ Onboarded therapists")
-        print(f"   ✅ Added {new_stats['total_therapists']} therapists to database")
+        # Check if database was populated
+        print("\n📊 Database After Autonomous Action:")
+        new_stats = therapist_db.get_statistics()
+        print(f"   • Total Therapists: {new_stats['total_therapists']}")
+        print(f"   • Available: {new_stats['available']}")
         print()
 
-    # Restore original database
-    therapist_db.therapists = original_therapists
-    print("🔄 Database restored to original state")
+        if new_stats['total_therapists'] > 0:
+            print("🎉 AUTONOMY DEMONSTRATED!")
+            print("   The agent autonomously:")
+            print("   ✅ Detected problem (empty database)")
+            print("   ✅ Decided to search for solution")
+            print("   ✅ Executed web search")
+            print("   ✅ Onboarded therapists")
+            print(f"   ✅ Added {new_stats['total_therapists']} therapists to database")
+            print()
+
+    finally:
+        # Restore original database even if the workflow blows up -
+        # later scenarios depend on the seeded therapists being back
+        therapist_db.replace_all(original_therapists)
+        print("🔄 Database restored to original state")
 
     print("✅ SCENARIO 3 COMPLETE: Autonomous behavior successfully demonstrated\n")
 
@@ -346,19 +462,32 @@ async def scenario_4_privacy_tiers():
     print(f'   "{user_message}"')
     print()
 
-    for tier, description in privacy_tiers:
+    # The four tier runs are independent and LLM-bound, so they fan out
+    # concurrently under a bounded semaphore; results are zipped back
+    # with privacy_tiers so the printed order stays deterministic
+    sem = asyncio.Semaphore(4)
+
+    async def _bounded(tier: str):
+        # The workflow is only started once the semaphore is held, so
+        # the bound applies to launches rather than just awaits
+        async with sem:
+            return await _run_workflow_cached(
+                user_message=user_message,
+                user_id=f"demo_privacy_{tier}",
+                privacy_tier=tier
+            )
+
+    results = await asyncio.gather(*(
+        _bounded(tier) for tier, _ in privacy_tiers
+    ))
+
+    for (tier, description), result in zip(privacy_tiers, results):
         print(f"\n🔒 Privacy Tier: {tier.upper().replace('_', ' ')}")
         print(f"   {description}")
         print("   " + "─" * 60)
 
-        result = await run_crisis_resource_workflow(
-            user_message=user_message,
-            user_id=f"demo_privacy_{tier}",
-            privacy_tier=tier
-        )
-
         # Show how behavior differs
-        print(f"   📊 Risk assessed: {result.get('risk_level', 'N/A')}")
+        print(f"   📊 Risk assessed: {result.risk_level}")
         print(f"   🤖 AI involvement: {tier}")
         print()
 
@@ -384,24 +513,29 @@ async def main():
     print()
 
     # Auto-start demo (no input required for non-interactive mode)
-    print("Starting demo in 2 seconds...")
-    await asyncio.sleep(2)
+    print(f"Starting demo in {DEMO_PAUSE:g} seconds...")
+    await _demo_pause()
 
     try:
-        # Scenario 1: High-risk crisis
-        await scenario_1_high_risk_crisis()
-        await asyncio.sleep(2)
-
-        # Scenario 2: Low-risk support
-        await scenario_2_low_risk_support()
-        await asyncio.sleep(2)
+        # Scenarios 1, 2 and 4 touch independent users and spend nearly
+        # all their time waiting on LLM/tool I/O, so they run
+        # concurrently - wall clock drops to roughly the slowest one.
+        # Each scenario's transcript is buffered and printed as one
+        # block when it completes.
+        results = await asyncio.gather(
+            _run_buffered(scenario_1_high_risk_crisis),
+            _run_buffered(scenario_2_low_risk_support),
+            _run_buffered(scenario_4_privacy_tiers),
+            return_exceptions=True,
+        )
+        for scenario_result in results:
+            if isinstance(scenario_result, BaseException):
+                raise scenario_result
+        await _demo_pause()
 
-        # Scenario 3: Autonomous search (THE BIG ONE!)
+        # Scenario 3 clears and restores the shared therapist_db, so it
+        # runs alone after the others (THE BIG ONE!)
         await scenario_3_autonomous_search()
-        await asyncio.sleep(2)
-
-        # Scenario 4: Privacy tiers
-        await scenario_4_privacy_tiers()
 
         # Final summary
         print_section_header("Demo Complete!", "🎉")
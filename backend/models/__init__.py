@@ -9,22 +9,43 @@ Models:
 - User: User profiles with privacy tiers
 - Habit: Therapeutic homework tracking
 - Session: Therapy session records
+
+Submodules load lazily (PEP 562): importing `Habit` alone no longer
+pays for building the Therapist/User/Session pydantic models too.
 """
 
-from .therapist import Therapist, TimeSlot, TherapistSpecialization
-from .user import User, PrivacyTier
-from .habit import Habit, HabitFrequency, HabitStatus
-from .session import Session, SessionStatus
-
-__all__ = [
-    "Therapist",
-    "TimeSlot",
-    "TherapistSpecialization",
-    "User",
-    "PrivacyTier",
-    "Habit",
-    "HabitFrequency",
-    "HabitStatus",
-    "Session",
-    "SessionStatus",
-]
+import importlib
+
+# name -> submodule that defines it
+_LAZY = {
+    "Therapist": ".therapist",
+    "TimeSlot": ".therapist",
+    "TherapistSpecialization": ".therapist",
+    "User": ".user",
+    "PrivacyTier": ".user",
+    "Habit": ".habit",
+    "HabitFrequency": ".habit",
+    "HabitStatus": ".habit",
+    "Session": ".session",
+    "SessionStatus": ".session",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access, then cache them."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
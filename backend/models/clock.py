@@ -0,0 +1,55 @@
+"""
+Shared Model Clock - Coarse timestamps for default factories
+=============================================================
+
+Session, Therapist and User each stamp one or two datetime fields on
+construction. datetime.now() allocates a fresh object and can hit a
+syscall on every call, which adds up in bulk flows (mock database
+load, imports, replay). current_time() instead serves a cached
+datetime refreshed at most every few milliseconds behind a cheap
+time.monotonic() gate, and pinned_time() freezes it entirely so a
+batch of constructions shares a single allocation.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+# How stale a served timestamp may be, in seconds. Creation metadata
+# doesn't need sub-centisecond resolution.
+_REFRESH_INTERVAL = 0.005
+
+# Batch-scoped override, set by pinned_time()
+_PINNED: contextvars.ContextVar = contextvars.ContextVar(
+    "model_clock_pin", default=None
+)
+
+_cached_now = datetime.now()
+_cached_at = time.monotonic()
+
+
+def current_time() -> datetime:
+    """Coarse datetime.now(), cached behind a monotonic gate."""
+    global _cached_now, _cached_at
+
+    pinned = _PINNED.get()
+    if pinned is not None:
+        return pinned
+
+    elapsed = time.monotonic()
+    if elapsed - _cached_at >= _REFRESH_INTERVAL:
+        _cached_now = datetime.now()
+        _cached_at = elapsed
+    return _cached_now
+
+
+@contextmanager
+def pinned_time(moment: Optional[datetime] = None):
+    """Pin current_time() for a bulk-construction block."""
+    token = _PINNED.set(moment or datetime.now())
+    try:
+        yield
+    finally:
+        _PINNED.reset(token)
@@ -2,11 +2,68 @@
 Habit Model - Therapeutic homework and habit tracking
 """
 
-from typing import Optional, List, Dict, Any
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, List
+
+import numpy as np
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    # orjson is a C extension; serialization falls back to pydantic's
+    # own encoder if it isn't installed so habits keep dumping anywhere.
+    _HAS_ORJSON = False
+
 from datetime import datetime
 from datetime import date as date_type
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+
+# Request-scoped "today": a stats pass over many habits sets this once
+# so every days_active read inside the context shares one clock call
+_TODAY: contextvars.ContextVar = contextvars.ContextVar("habit_today", default=None)
+
+
+@contextmanager
+def frozen_today(today: Optional[date_type] = None):
+    """Pin date.today() for all habit date math inside the block."""
+    token = _TODAY.set(today or date_type.today())
+    try:
+        yield
+    finally:
+        _TODAY.reset(token)
+
+
+# Batch-scoped "now" for default timestamps: datetime.now() is heavy
+# enough to show up when constructing hundreds of habits in one load
+_CTX_NOW: contextvars.ContextVar = contextvars.ContextVar("habit_now", default=None)
+
+
+def _now_cached() -> datetime:
+    """Pinned batch timestamp if one is set, else the real clock."""
+    now = _CTX_NOW.get()
+    return now if now is not None else datetime.now()
+
+
+@contextmanager
+def frozen_now(now: Optional[datetime] = None):
+    """Pin default created_at timestamps for a bulk-construction block."""
+    token = _CTX_NOW.set(now or datetime.now())
+    try:
+        yield
+    finally:
+        _CTX_NOW.reset(token)
 
 
 # How often the habit should be performed
@@ -26,20 +83,80 @@ class HabitStatus(str, Enum):
     ABANDONED = "abandoned"            # User stopped
 
 
+# Direct value -> member maps so bulk habit deserialization coerces
+# enum strings with one dict lookup instead of pydantic's member scan
+_FREQ_MAP = {m.value: m for m in HabitFrequency}
+_STATUS_MAP = {m.value: m for m in HabitStatus}
+
+
 # Individual completion record
 class HabitCompletion(BaseModel):
     """Single completion record for a habit."""
 
+    # defer_build skips compiling the validator core at import; paths
+    # that never construct a habit (most of them) never pay for it
+    model_config = ConfigDict(defer_build=True)
+
     date: date_type = Field(..., description="When completed")
     completed: bool = Field(..., description="Whether completed")
     notes: Optional[str] = Field(None, description="User notes")
     reminded: bool = Field(default=False, description="Whether agent reminded user")
 
 
+@dataclass
+class HabitCompletionStore:
+    """
+    Struct-of-arrays view of a completion history.
+
+    A year of daily HabitCompletion models is 365 Python objects that
+    aggregate code walks one attribute access at a time; as parallel
+    NumPy columns the same history is a few KB and every statistic is
+    one vectorized expression. Only the columns the aggregates touch
+    are materialized - notes/reminded stay on the pydantic models.
+    """
+
+    dates: np.ndarray      # datetime64[D]
+    completed: np.ndarray  # bool
+
+    @classmethod
+    def from_completions(
+        cls, completions: List[HabitCompletion]
+    ) -> "HabitCompletionStore":
+        n = len(completions)
+        dates = np.empty(n, dtype="datetime64[D]")
+        completed = np.empty(n, dtype=bool)
+        for i, completion in enumerate(completions):
+            dates[i] = completion.date
+            completed[i] = completion.completed
+        return cls(dates=dates, completed=completed)
+
+
 # Main habit model
 class Habit(BaseModel):
     """Therapeutic homework assigned by therapist and tracked by Habit Agent."""
 
+    # Native v2 config: the v1-compat `class Config` path is slower,
+    # and defer_build postpones compiling the validator core until the
+    # first Habit is actually constructed
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
+            "example": {
+                "id": "habit_001",
+                "user_id": "user_001",
+                "name": "Meditate for 10 minutes",
+                "frequency": "daily",
+                "duration_minutes": 10,
+                "target_days": 30,
+                "status": "active",
+                "reminder_time": "09:00",
+                "auto_check_enabled": True,
+                "difficulty_level": 1,
+                "created_by": "therapist"
+            }
+        },
+    )
+
     # Identification
     id: str = Field(..., description="Unique habit identifier")
     user_id: str = Field(..., description="User this habit belongs to")
@@ -113,7 +230,7 @@ class Habit(BaseModel):
         description="Who created: 'user', 'therapist', 'agent'"
     )
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now_cached,
         description="When created"
     )
     last_completed: Optional[datetime] = Field(
@@ -121,15 +238,62 @@ class Habit(BaseModel):
         description="Last successful completion"
     )
 
+    # Running completion counters - kept in sync by add_completion so
+    # completion_rate is an O(1) read instead of a full-history scan on
+    # every dashboard render
+    _completed_count: int = PrivateAttr(default=0)
+    _total_count: int = PrivateAttr(default=0)
+
+    # Lazily materialized SoA view of completions, invalidated on append
+    _store: Optional[HabitCompletionStore] = PrivateAttr(default=None)
+
+    @field_validator("frequency", mode="before")
+    @classmethod
+    def _coerce_frequency(cls, value):
+        """Fast-path string -> enum coercion via the value map."""
+        if isinstance(value, str):
+            return _FREQ_MAP.get(value, value)
+        return value
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _coerce_status(cls, value):
+        """Fast-path string -> enum coercion via the value map."""
+        if isinstance(value, str):
+            return _STATUS_MAP.get(value, value)
+        return value
+
+    @model_validator(mode="after")
+    def _init_completion_counters(self) -> "Habit":
+        """Seed the counters from history on load/construction."""
+        self._total_count = len(self.completions)
+        self._completed_count = sum(1 for c in self.completions if c.completed)
+        return self
+
+    def add_completion(self, completion: HabitCompletion) -> None:
+        """Record a completion and keep the rate counters in sync."""
+        self.completions.append(completion)
+        self._total_count += 1
+        if completion.completed:
+            self._completed_count += 1
+        # Derived columns go stale on append; rebuilt on next read
+        self._store = None
+
+    @property
+    def _completion_store(self) -> HabitCompletionStore:
+        """The SoA view, rebuilt only after completions change."""
+        if self._store is None:
+            self._store = HabitCompletionStore.from_completions(self.completions)
+        return self._store
+
     # Computed properties
     @property
     def completion_rate(self) -> float:
         """Calculate percentage of days completed."""
-        if not self.completions:
+        if not self._total_count:
             return 0.0
 
-        completed_count = sum(1 for c in self.completions if c.completed)
-        return (completed_count / len(self.completions)) * 100
+        return (self._completed_count / self._total_count) * 100
 
     @property
     def current_streak(self) -> int:
@@ -137,40 +301,52 @@ class Habit(BaseModel):
         if not self.completions:
             return 0
 
-        # Sort by date (newest first)
-        sorted_completions = sorted(
-            self.completions,
-            key=lambda x: x.date,
-            reverse=True
-        )
+        # Vectorized over the SoA columns: bucket entries by day (a
+        # failed entry breaks that day), then count how many trailing
+        # days are both completed and consecutive - a missing day ends
+        # the streak, since streaks are consecutive days, not records.
+        store = self._completion_store
+        unique_dates, inverse = np.unique(store.dates, return_inverse=True)
+        day_ok = np.ones(len(unique_dates), dtype=bool)
+        np.logical_and.at(day_ok, inverse, store.completed)
+
+        ok_newest_first = day_ok[::-1]
+        if not ok_newest_first[0]:
+            return 0
 
-        streak = 0
-        for completion in sorted_completions:
-            if completion.completed:
-                streak += 1
-            else:
-                break
+        # Length of the trailing all-completed run of days
+        failures = np.flatnonzero(~ok_newest_first)
+        run = int(failures[0]) if failures.size else len(ok_newest_first)
 
-        return streak
+        # Cut the run at the first calendar gap (dates are unique and
+        # sorted, so consecutive days differ by exactly one)
+        day_numbers = unique_dates[::-1][:run].astype("int64")
+        gaps = np.flatnonzero(np.diff(day_numbers) != -1)
+        return int(gaps[0]) + 1 if gaps.size else run
 
     @property
     def days_active(self) -> int:
         """How many days has this habit been tracked."""
-        return (date_type.today() - self.start_date).days
+        today = _TODAY.get() or date_type.today()
+        return (today - self.start_date).days
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "habit_001",
-                "user_id": "user_001",
-                "name": "Meditate for 10 minutes",
-                "frequency": "daily",
-                "duration_minutes": 10,
-                "target_days": 30,
-                "status": "active",
-                "reminder_time": "09:00",
-                "auto_check_enabled": True,
-                "difficulty_level": 1,
-                "created_by": "therapist"
-            }
-        }
+def dump_habit(habit: Habit) -> bytes:
+    """
+    Serialize a habit to JSON bytes on the fastest available path.
+
+    orjson renders dates/datetimes natively and is several times
+    faster than pydantic's encoder - worth it when logging whole
+    habit plans or streaming them over the API.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(habit.model_dump(mode="json"))
+    return habit.model_dump_json().encode()
+
+
+def bulk_days_active(
+    habits: List[Habit],
+    today: Optional[date_type] = None
+) -> List[int]:
+    """Days active for many habits with a single clock read."""
+    today = today or date_type.today()
+    return [(today - habit.start_date).days for habit in habits]
@@ -5,7 +5,9 @@ Session Model - Therapy session records
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from models.clock import current_time
 
 
 # Session status tracking
@@ -22,6 +24,24 @@ class SessionStatus(str, Enum):
 class Session(BaseModel):
     """Therapy session between user and therapist."""
 
+    # Native v2 config - the v1-compat `class Config` path carries
+    # extra per-class overhead
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "session_001",
+                "user_id": "user_001",
+                "therapist_id": "therapist_001",
+                "scheduled_time": "2025-10-27T14:00:00",
+                "duration_minutes": 50,
+                "status": "completed",
+                "session_type": "individual",
+                "focus_areas": ["anxiety", "coping_strategies"],
+                "homework_assigned": ["Meditate 10 min daily", "Journal before bed"]
+            }
+        },
+    )
+
     # Identification
     id: str = Field(..., description="Unique session identifier")
     user_id: str = Field(..., description="User in session")
@@ -81,21 +101,6 @@ class Session(BaseModel):
 
     # Metadata
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=current_time,
         description="When session was created/scheduled"
     )
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "session_001",
-                "user_id": "user_001",
-                "therapist_id": "therapist_001",
-                "scheduled_time": "2025-10-27T14:00:00",
-                "duration_minutes": 50,
-                "status": "completed",
-                "session_type": "individual",
-                "focus_areas": ["anxiety", "coping_strategies"],
-                "homework_assigned": ["Meditate 10 min daily", "Journal before bed"]
-            }
-        }
@@ -2,10 +2,28 @@
 Therapist Model - Volunteer therapist profiles and availability
 """
 
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional
 from datetime import datetime, time
 from enum import Enum
-from pydantic import BaseModel, Field, EmailStr
+from functools import cached_property
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from models.clock import current_time
+
+
+# Cheap shape check for internally ingested rows - the full EmailStr
+# stack (email-validator: Unicode normalization, deliverability rules)
+# is per-object cost the trusted mock/agent paths don't need. Signup
+# forms at the API edge are where strict validation belongs.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 # Therapist specializations - what issues they can help with
@@ -22,10 +40,37 @@ class TherapistSpecialization(str, Enum):
     GENERAL = "general"
 
 
+# Day name -> datetime.weekday() index, for integer day comparisons
+_DAY_INDEX = {
+    "Monday": 0,
+    "Tuesday": 1,
+    "Wednesday": 2,
+    "Thursday": 3,
+    "Friday": 4,
+    "Saturday": 5,
+    "Sunday": 6,
+}
+
+
 # Available time slots for therapy sessions
 class TimeSlot(BaseModel):
     """Represents an available time slot for therapy sessions."""
 
+    # Native v2 config - the v1-compat `class Config` path carries
+    # extra per-class overhead
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "day_of_week": "Monday",
+                "start_time": "14:00",
+                "end_time": "16:00",
+                "timezone": "America/New_York",
+                "is_available": True,
+                "recurring": True
+            }
+        },
+    )
+
     day_of_week: str  # "Monday", "Tuesday", etc.
     start_time: str   # "09:00" (24-hour format)
     end_time: str     # "17:00"
@@ -35,30 +80,61 @@ class TimeSlot(BaseModel):
     is_available: bool = True
     recurring: bool = True  # If true, available every week
 
-    class Config:
-        # Example for documentation
-        json_schema_extra = {
-            "example": {
-                "day_of_week": "Monday",
-                "start_time": "14:00",
-                "end_time": "16:00",
-                "timezone": "America/New_York",
-                "is_available": True,
-                "recurring": True
-            }
-        }
+    # Integer mirrors of the schedule strings, parsed once at
+    # construction so range checks are plain int comparisons instead
+    # of strptime calls on every scheduling pass
+    day_index: int = -1
+    start_minutes: int = 0
+    end_minutes: int = 0
+
+    @model_validator(mode="after")
+    def _parse_schedule(self) -> "TimeSlot":
+        """Mirror the display strings into the integer fields."""
+        self.day_index = _DAY_INDEX.get(self.day_of_week, -1)
+        hours, _, minutes = self.start_time.partition(":")
+        self.start_minutes = int(hours) * 60 + int(minutes)
+        hours, _, minutes = self.end_time.partition(":")
+        self.end_minutes = int(hours) * 60 + int(minutes)
+        return self
+
+    def covers(self, moment: datetime) -> bool:
+        """Whether this slot covers the given moment (slot-local time)."""
+        if not self.is_available:
+            return False
+        minutes = moment.hour * 60 + moment.minute
+        return (
+            self.day_index == moment.weekday()
+            and self.start_minutes <= minutes < self.end_minutes
+        )
 
 
 # Main therapist model
 class Therapist(BaseModel):
     """Volunteer therapist profile with availability and specializations."""
 
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "therapist_001",
+                "name": "Dr. Sarah Johnson",
+                "email": "sarah.johnson@mindbridge.org",
+                "specializations": ["anxiety", "depression"],
+                "years_experience": 8,
+                "is_volunteer": True,
+                "status": "active",
+                "max_patients": 10,
+                "current_patients": 3,
+                "bio": "Licensed psychologist specializing in anxiety and depression..."
+            }
+        },
+    )
+
     # Identification
     id: str = Field(..., description="Unique therapist identifier")
     name: str = Field(..., description="Full name")
 
     # Contact
-    email: EmailStr = Field(..., description="Contact email")
+    email: str = Field(..., description="Contact email")
     phone: Optional[str] = Field(None, description="Phone number (optional)")
 
     # Professional info
@@ -95,44 +171,75 @@ class Therapist(BaseModel):
 
     # Metadata
     joined_date: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=current_time,
         description="When therapist joined platform"
     )
     last_active: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=current_time,
         description="Last activity timestamp"
     )
 
-    # Computed properties
-    @property
-    def is_available(self) -> bool:
-        """Check if therapist can take new patients."""
-        return (
+    # Availability is read far more often than it changes - every
+    # database query and statistics pass checks it per therapist, but
+    # only booking and status changes can move it. Materialize both
+    # values and recompute them at those write points.
+    _is_available: bool = PrivateAttr(default=False)
+    _availability_pct: float = PrivateAttr(default=0.0)
+
+    # JSON-ready dump, lazily built and cleared by the database
+    # mutators - exports reuse it instead of re-dumping every field
+    _dump_cache: Optional[Dict] = PrivateAttr(default=None)
+
+    @field_validator("email")
+    @classmethod
+    def _check_email_shape(cls, value: str) -> str:
+        """One compiled-regex probe instead of the email-validator stack."""
+        if not _EMAIL_RE.match(value):
+            raise ValueError(f"invalid email address: {value!r}")
+        return value
+
+    @model_validator(mode="after")
+    def _init_availability(self) -> "Therapist":
+        """Seed the materialized availability on load/construction."""
+        self._recompute_availability()
+        return self
+
+    def _recompute_availability(self) -> None:
+        """Refresh the cached availability after a mutation."""
+        self._is_available = (
             self.status == "active" and
             self.current_patients < self.max_patients and
             len(self.time_slots) > 0
         )
+        self._availability_pct = (
+            (self.current_patients / self.max_patients) * 100
+            if self.max_patients
+            else 0.0
+        )
+
+    def dump_cached(self) -> Dict:
+        """JSON-serializable dump, recomputed only after mutations."""
+        if self._dump_cache is None:
+            self._dump_cache = self.model_dump(mode="json")
+        return self._dump_cache
+
+    # Computed properties
+    @property
+    def is_available(self) -> bool:
+        """Check if therapist can take new patients."""
+        return self._is_available
+
+    @cached_property
+    def specialization_values(self) -> List[str]:
+        """
+        Specializations as plain strings, materialized once.
+
+        API payloads list these for every returned therapist; caching
+        avoids rebuilding the same list on every query.
+        """
+        return [s.value for s in self.specializations]
 
     @property
     def availability_percentage(self) -> float:
-        """Calculate how full the therapist's schedule is."""
-        if self.max_patients == 0:
-            return 0.0
-        return (self.current_patients / self.max_patients) * 100
-
-    class Config:
-        # Example for documentation
-        json_schema_extra = {
-            "example": {
-                "id": "therapist_001",
-                "name": "Dr. Sarah Johnson",
-                "email": "sarah.johnson@mindbridge.org",
-                "specializations": ["anxiety", "depression"],
-                "years_experience": 8,
-                "is_volunteer": True,
-                "status": "active",
-                "max_patients": 10,
-                "current_patients": 3,
-                "bio": "Licensed psychologist specializing in anxiety and depression..."
-            }
-        }
+        """How full the therapist's schedule is."""
+        return self._availability_pct
@@ -5,7 +5,9 @@ User Model - User profiles with privacy tier control
 from typing import Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+
+from models.clock import current_time
 
 
 # Privacy tiers - how much AI assistance user allows
@@ -37,6 +39,22 @@ class PrivacyTier(str, Enum):
 class User(BaseModel):
     """User profile with privacy controls."""
 
+    # Native v2 config - the v1-compat `class Config` path carries
+    # extra per-class overhead
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "user_001",
+                "email": "user@example.com",
+                "privacy_tier": "full_support",
+                "age": 28,
+                "location": "New York, NY",
+                "is_active": True,
+                "in_crisis": False
+            }
+        },
+    )
+
     # Identification
     id: str = Field(..., description="Unique user identifier")
     email: Optional[EmailStr] = Field(None, description="Email (optional based on privacy)")
@@ -68,11 +86,11 @@ class User(BaseModel):
 
     # Metadata
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=current_time,
         description="Account creation date"
     )
     last_active: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=current_time,
         description="Last activity"
     )
 
@@ -81,16 +99,3 @@ class User(BaseModel):
         default=False,
         description="Explicitly consented to data collection"
     )
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "user_001",
-                "email": "user@example.com",
-                "privacy_tier": "full_support",
-                "age": 28,
-                "location": "New York, NY",
-                "is_active": True,
-                "in_crisis": False
-            }
-        }
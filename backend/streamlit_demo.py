@@ -18,6 +18,8 @@ Run with: streamlit run streamlit_demo.py
 
 import streamlit as st
 import asyncio
+import os
+from collections import deque
 from datetime import datetime
 from typing import List, Dict, Any
 import time
@@ -26,6 +28,7 @@ import time
 from langchain_core.messages import HumanMessage, AIMessage
 
 # Our components
+from workflows import abatch_crisis
 from workflows.crisis_to_resource import create_crisis_resource_workflow
 from agents.base_agent import AgentState
 from models.mock_data import therapist_db
@@ -46,29 +49,6 @@ st.markdown("""
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
     }
 
-    /* Chat messages */
-    .user-message {
-        background: #4CAF50;
-        color: white;
-        padding: 12px 16px;
-        border-radius: 12px;
-        margin: 8px 0;
-        max-width: 80%;
-        float: right;
-        clear: both;
-    }
-
-    .ai-message {
-        background: #2196F3;
-        color: white;
-        padding: 12px 16px;
-        border-radius: 12px;
-        margin: 8px 0;
-        max-width: 80%;
-        float: left;
-        clear: both;
-    }
-
     /* Agent status */
     .agent-active {
         background: #FF9800;
@@ -108,21 +88,103 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
+# Scenario button label -> canned message, shared by the sidebar
+# buttons and the optional startup warm-up batch
+_SCENARIOS = {
+    "🚨 High-Risk Crisis": "I feel completely hopeless. I don't think I can go on anymore. Everything hurts.",
+    "😰 Moderate Anxiety": "I've been having panic attacks and can't sleep. I really need help.",
+    "😊 General Support": "I'm feeling a bit stressed about work. Just need someone to talk to.",
+}
+
+# Agent name -> log icon, built once at module scope
+_AGENT_ICONS = {
+    'Crisis Agent': '🚨',
+    'Resource Agent': '🔍',
+    'Coordinator': '🎯',
+    'System': '⚙️'
+}
+
+
+def _initial_state(user_message: str, privacy_tier: str) -> Dict[str, Any]:
+    """Fresh workflow input state for one user message."""
+    return {
+        'messages': [HumanMessage(content=user_message)],
+        'user_id': 'demo_user',
+        'privacy_tier': privacy_tier,
+        'risk_level': None,
+        'crisis_detected': False,
+        'therapist_matched': False,
+        'matched_therapist_id': None,
+        'matched_therapist_name': None,
+        'next_step': None,
+        'workflow_complete': False
+    }
+
+
+@st.cache_resource
+def _get_workflow():
+    """
+    Compile the LangGraph workflow once per process.
+
+    Streamlit reruns this script top to bottom on every interaction;
+    without the cache each message re-instantiated every agent and
+    re-compiled the graph before doing any actual work.
+
+    With DEMO_PRELOAD set, the three demo scenarios are pre-run here as
+    one parallel abatch so LLM connection pools and prompt caches are
+    hot before the presenter clicks a button. Opt-in because the warm-up
+    issues real LLM calls and books therapists in the mock database.
+    """
+    workflow = create_crisis_resource_workflow()
+    if os.getenv("DEMO_PRELOAD"):
+        inputs = [
+            _initial_state(message, "no_records")
+            for message in _SCENARIOS.values()
+        ]
+        asyncio.new_event_loop().run_until_complete(
+            abatch_crisis(workflow, inputs)
+        )
+    return workflow
+
+
+@st.cache_data(ttl=5)
+def _get_db_stats():
+    """Database statistics for the sidebar, refreshed at most every 5s."""
+    return therapist_db.get_statistics()
+
+
+def _run_async(coro):
+    """
+    Drive a coroutine on the session's persistent event loop.
+
+    asyncio.run builds and tears down a fresh loop per call, dropping
+    the pooled HTTP connections the agents' async clients keep alive;
+    reusing one loop keeps them warm across turns.
+    """
+    if 'loop' not in st.session_state:
+        st.session_state.loop = asyncio.new_event_loop()
+    return st.session_state.loop.run_until_complete(coro)
+
+
+# Initialize session state - chat history and logs are bounded deques,
+# not bare lists: only the tail is ever rendered, and session_state is
+# re-serialized every rerun, so unbounded growth taxes every interaction
 if 'messages' not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = deque(maxlen=100)
 if 'workflow_state' not in st.session_state:
     st.session_state.workflow_state = None
 if 'agent_logs' not in st.session_state:
-    st.session_state.agent_logs = []
+    st.session_state.agent_logs = deque(maxlen=200)
 if 'current_agent' not in st.session_state:
     st.session_state.current_agent = None
 
 
 def add_agent_log(agent: str, action: str, details: str = ""):
     """Add entry to agent reasoning log."""
+    # Store the raw timestamp; strftime runs only for the handful of
+    # entries the log pane actually renders
     st.session_state.agent_logs.append({
-        'timestamp': datetime.now().strftime("%H:%M:%S"),
+        'ts_ns': time.time_ns(),
         'agent': agent,
         'action': action,
         'details': details
@@ -131,45 +193,39 @@ def add_agent_log(agent: str, action: str, details: str = ""):
 
 def display_agent_logs():
     """Display agent reasoning in real-time."""
-    st.markdown("### 🧠 Agent Reasoning (Live)")
+    # One markdown element for the whole pane, header and active-agent
+    # banner included - each st.markdown call is a separate DOM element
+    # Streamlit re-serializes to the frontend on every rerun
+    parts = ["### 🧠 Agent Reasoning (Live)"]
 
     # Current active agent
     if st.session_state.current_agent:
-        st.markdown(
-            f'<div class="agent-active">🔄 {st.session_state.current_agent} is working...</div>',
-            unsafe_allow_html=True
+        parts.append(
+            f'<div class="agent-active">🔄 {st.session_state.current_agent} is working...</div>'
         )
 
-    # Logs container
-    log_container = st.container()
-
-    with log_container:
-        for log in reversed(st.session_state.agent_logs[-10:]):  # Show last 10
-            timestamp = log['timestamp']
-            agent = log['agent']
-            action = log['action']
-            details = log['details']
-
-            # Agent icon
-            agent_icon = {
-                'Crisis Agent': '🚨',
-                'Resource Agent': '🔍',
-                'Coordinator': '🎯',
-                'System': '⚙️'
-            }.get(agent, '🤖')
+    entries = []
+    for log in reversed(list(st.session_state.agent_logs)[-10:]):  # Show last 10
+        agent_icon = _AGENT_ICONS.get(log['agent'], '🤖')
+        timestamp = datetime.fromtimestamp(log['ts_ns'] / 1e9).strftime("%H:%M:%S")
+        entry = (
+            f"**{timestamp}** {agent_icon} **{log['agent']}**\n\n"
+            f"└─ {log['action']}"
+        )
+        if log['details']:
+            entry += f"\n\n```\n{log['details']}\n```"
+        entries.append(entry)
+    if entries:
+        parts.append("\n\n---\n\n".join(entries))
 
-            st.markdown(f"**{timestamp}** {agent_icon} **{agent}**")
-            st.markdown(f"└─ {action}")
-            if details:
-                st.markdown(f"   ```\n   {details}\n   ```")
-            st.markdown("---")
+    st.markdown("\n\n".join(parts), unsafe_allow_html=True)
 
 
 def display_database_stats():
     """Show current therapist database status."""
     st.markdown("### 📊 Therapist Database")
 
-    stats = therapist_db.get_statistics()
+    stats = _get_db_stats()
 
     col1, col2, col3 = st.columns(3)
 
@@ -235,32 +291,19 @@ async def process_message(user_message: str, privacy_tier: str):
     st.session_state.messages.append({
         'role': 'user',
         'content': user_message,
-        'timestamp': datetime.now()
+        'ts_ns': time.time_ns()
     })
 
     # Log start
     add_agent_log('System', 'New message received', user_message[:100])
     st.session_state.current_agent = 'Coordinator'
 
-    # Create workflow
-    add_agent_log('Coordinator', 'Creating multi-agent workflow')
-    workflow = create_crisis_resource_workflow()
+    # Reuse the cached workflow - compiled once, not per message
+    add_agent_log('Coordinator', 'Preparing multi-agent workflow')
+    workflow = _get_workflow()
 
     # Initialize state
-    from langchain_core.messages import HumanMessage
-
-    initial_state = {
-        'messages': [HumanMessage(content=user_message)],
-        'user_id': 'demo_user',
-        'privacy_tier': privacy_tier,
-        'risk_level': None,
-        'crisis_detected': False,
-        'therapist_matched': False,
-        'matched_therapist_id': None,
-        'matched_therapist_name': None,
-        'next_step': None,
-        'workflow_complete': False
-    }
+    initial_state = _initial_state(user_message, privacy_tier)
 
     # Run workflow with step tracking
     add_agent_log('Coordinator', 'Starting Crisis Agent')
@@ -279,11 +322,58 @@ async def process_message(user_message: str, privacy_tier: str):
         st.session_state.messages.append({
             'role': 'assistant',
             'content': ai_response,
-            'timestamp': datetime.now()
+            'ts_ns': time.time_ns()
         })
 
     add_agent_log('System', 'Workflow complete', f"Risk: {final_state.get('risk_level')}")
 
+    # A matched therapist means a booking mutated the database - drop
+    # the cached sidebar stats so the next render shows fresh counts
+    # instead of waiting out the TTL
+    if final_state.get('therapist_matched'):
+        _get_db_stats.clear()
+
+
+@st.fragment
+def _conversation_fragment(privacy_tier: str):
+    """
+    Chat and reasoning panes as one fragment.
+
+    A chat turn only needs these two columns to update; scoping them to
+    a fragment means sending a message reruns this function alone
+    instead of the whole script (sidebar, DB stats, CSS injection).
+    Sidebar scenario buttons still trigger a full rerun.
+    """
+    col_chat, col_reasoning = st.columns([1, 1])
+
+    # LEFT: Chat Interface
+    with col_chat:
+        st.markdown("### 💬 Chat Interface")
+
+        # Chat history - st.chat_message blocks diff efficiently across
+        # reruns, unlike raw per-message HTML injection
+        chat_container = st.container(height=400)
+        with chat_container:
+            for msg in st.session_state.messages:
+                with st.chat_message(msg['role']):
+                    st.write(msg['content'])
+
+        # Input
+        if user_input := st.chat_input("How are you feeling today?"):
+            with st.spinner("Processing..."):
+                _run_async(process_message(user_input, privacy_tier))
+            st.rerun(scope="fragment")
+
+    # RIGHT: Agent Reasoning
+    with col_reasoning:
+        # Workflow state
+        display_workflow_state()
+
+        st.markdown("---")
+
+        # Agent logs
+        display_agent_logs()
+
 
 def main():
     """Main Streamlit app."""
@@ -307,26 +397,16 @@ def main():
         # Pre-loaded scenarios
         st.markdown("### 📝 Quick Scenarios")
 
-        if st.button("🚨 High-Risk Crisis", use_container_width=True):
-            scenario_message = "I feel completely hopeless. I don't think I can go on anymore. Everything hurts."
-            asyncio.run(process_message(scenario_message, privacy_tier))
-            st.rerun()
-
-        if st.button("😰 Moderate Anxiety", use_container_width=True):
-            scenario_message = "I've been having panic attacks and can't sleep. I really need help."
-            asyncio.run(process_message(scenario_message, privacy_tier))
-            st.rerun()
-
-        if st.button("😊 General Support", use_container_width=True):
-            scenario_message = "I'm feeling a bit stressed about work. Just need someone to talk to."
-            asyncio.run(process_message(scenario_message, privacy_tier))
-            st.rerun()
+        for label, scenario_message in _SCENARIOS.items():
+            if st.button(label, use_container_width=True):
+                _run_async(process_message(scenario_message, privacy_tier))
+                st.rerun()
 
         # Clear button
         if st.button("🔄 Clear Chat", use_container_width=True):
-            st.session_state.messages = []
+            st.session_state.messages.clear()
             st.session_state.workflow_state = None
-            st.session_state.agent_logs = []
+            st.session_state.agent_logs.clear()
             st.session_state.current_agent = None
             st.rerun()
 
@@ -336,45 +416,7 @@ def main():
         display_database_stats()
 
     # Main content: Split screen
-    col_chat, col_reasoning = st.columns([1, 1])
-
-    # LEFT: Chat Interface
-    with col_chat:
-        st.markdown("### 💬 Chat Interface")
-
-        # Chat history
-        chat_container = st.container(height=400)
-        with chat_container:
-            for msg in st.session_state.messages:
-                role = msg['role']
-                content = msg['content']
-
-                if role == 'user':
-                    st.markdown(f'<div class="user-message">👤 {content}</div>', unsafe_allow_html=True)
-                else:
-                    st.markdown(f'<div class="ai-message">🤖 {content}</div>', unsafe_allow_html=True)
-
-        # Input
-        user_input = st.text_input(
-            "Your message:",
-            placeholder="How are you feeling today?",
-            key="user_input"
-        )
-
-        if st.button("Send", use_container_width=True) and user_input:
-            with st.spinner("Processing..."):
-                asyncio.run(process_message(user_input, privacy_tier))
-            st.rerun()
-
-    # RIGHT: Agent Reasoning
-    with col_reasoning:
-        # Workflow state
-        display_workflow_state()
-
-        st.markdown("---")
-
-        # Agent logs
-        display_agent_logs()
+    _conversation_fragment(privacy_tier)
 
     # Footer
     st.markdown("---")
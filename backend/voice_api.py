@@ -10,22 +10,48 @@ Run with: uvicorn voice_api:app --reload --port 8000
 """
 
 from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Query
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from cachetools import TTLCache
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+import asyncio
+import httpx
+import json
+import threading
 import uvicorn
 import os
 from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
 from datetime import datetime
+from loguru import logger
+
+# Optional non-blocking file I/O - uploads fall back to thread-pool
+# writes when aiofiles isn't installed
+try:
+    import aiofiles
+    _HAS_AIOFILES = True
+except ImportError:
+    _HAS_AIOFILES = False
+
+# Optional fast JSON encoder for cached response payloads
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 # Load environment variables
 load_dotenv()
 
-# Initialize ElevenLabs client
+# Initialize ElevenLabs client with a persistent connection pool -
+# consecutive TTS turns reuse the kept-alive TLS connection instead of
+# paying a fresh handshake (easily 100-300ms) per call
 elevenlabs_client = ElevenLabs(
-    api_key=os.getenv("ELEVENLABS_API_KEY")
+    api_key=os.getenv("ELEVENLABS_API_KEY"),
+    httpx_client=httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+    ),
 )
 
 from agents.intake_agent import IntakeAgent
@@ -35,7 +61,12 @@ from agents.resource_agent import ResourceAgent
 from models.mock_data import MOCK_THERAPISTS, therapist_db
 from models.therapist import Therapist
 
-app = FastAPI(title="MindBridge Voice API")
+# orjson-backed responses when available - C-extension serialization
+# for every endpoint's return dict instead of stdlib json on the loop
+app = FastAPI(
+    title="MindBridge Voice API",
+    default_response_class=ORJSONResponse if _HAS_ORJSON else JSONResponse,
+)
 
 # Enable CORS for browser access
 app.add_middleware(
@@ -46,8 +77,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Session storage (in production, use Redis or database)
-sessions = {}
+# Session storage (in production, use Redis or database). Bounded
+# LRU + TTL rather than a bare dict - every new user_id adds a full
+# message history, so an unbounded store is a slow leak on a
+# long-running server. Idle sessions expire after 30 minutes; eviction
+# is a no-op since session state is disposable.
+sessions = TTLCache(maxsize=1000, ttl=1800)
+_SESSIONS_LOCK = threading.RLock()
+
+# Shared agent singletons - agents own LLM clients, bound tools, and
+# system prompts but keep no per-user state (that lives in AgentState),
+# so one instance serves every session instead of rebuilding the whole
+# object graph per user
+INTAKE_AGENT = IntakeAgent()
+CRISIS_AGENT = CrisisAgent()
 
 
 class VoiceRequest(BaseModel):
@@ -80,18 +123,20 @@ async def process_voice_intake(request: VoiceRequest):
 
     session_id = request.session_id or request.user_id
 
-    # Get or create session
-    if session_id not in sessions:
-        sessions[session_id] = {
-            "agent": IntakeAgent(),
-            "state": AgentState(
-                user_id=request.user_id,
-                privacy_tier="full_support"
-            )
-        }
-
-    session = sessions[session_id]
-    agent = session["agent"]
+    # Get or create session - sessions hold only cheap state; the
+    # agents themselves are shared singletons
+    with _SESSIONS_LOCK:
+        session = sessions.get(session_id)
+        if session is None:
+            session = {
+                "state": AgentState(
+                    user_id=request.user_id,
+                    privacy_tier="full_support"
+                )
+            }
+            sessions[session_id] = session
+
+    agent = INTAKE_AGENT
     state = session["state"]
 
     # Add user message
@@ -114,10 +159,9 @@ async def process_voice_intake(request: VoiceRequest):
     # Update session
     session["state"] = state
 
-    # If intake complete, prepare for crisis assessment
-    if intake_complete and session_id in sessions:
-        # Add crisis agent to session
-        sessions[session_id]["crisis_agent"] = CrisisAgent()
+    # If intake complete, mark the session ready for crisis assessment
+    if intake_complete:
+        session["crisis_ready"] = True
 
     return VoiceResponse(
         response=agent_response,
@@ -128,8 +172,15 @@ async def process_voice_intake(request: VoiceRequest):
     )
 
 
+# Licence uploads stream to disk in chunks of this size; the size cap
+# is checked incrementally so an oversized file is rejected early
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+
+
 @app.post("/therapist/licence-upload")
 async def upload_licence(
+    request: Request,
     therapist_id: str = Query(..., alias="therapist-id"),
     file: UploadFile = File(...),
 ):
@@ -142,6 +193,12 @@ async def upload_licence(
     Form-Data:
     - file: the licence document (pdf, jpg, jpeg, png)
     """
+    # Reject declared-oversize requests before touching the body - the
+    # chunked read below still caps liars and chunked transfer encoding
+    declared_bytes = int(request.headers.get("content-length") or 0)
+    if declared_bytes > _UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+
     # Validate therapist exists
     therapist = therapist_db.get_therapist_by_id(therapist_id)
     if not therapist:
@@ -154,13 +211,6 @@ async def upload_licence(
     if ext not in allowed_ext:
         raise HTTPException(status_code=400, detail="Unsupported file type. Allowed: pdf, jpg, jpeg, png")
 
-    # Read file (size guard ~10MB)
-    content = await file.read()
-    size_bytes = len(content)
-    max_bytes = 10 * 1024 * 1024
-    if size_bytes > max_bytes:
-        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
-
     # Ensure upload directories exist
     base_dir = os.path.join(os.getcwd(), "uploads")
     therapist_dir = os.path.join(base_dir, therapist_id)
@@ -172,10 +222,39 @@ async def upload_licence(
     out_name = f"licence_{therapist_id}_{ts}{ext}"
     out_path = os.path.join(therapist_dir, out_name)
 
-    # Write to disk
+    # Stream to disk in 64KB chunks - memory stays constant regardless
+    # of file size, and the size cap is enforced as bytes arrive instead
+    # of after buffering the whole upload.
+    #
+    # PERFORMANCE NOTE: an io_uring backend (daemon thread batching
+    # write SQEs so many uploads share one submit syscall) was
+    # considered and rejected: it needs liburing bindings, is
+    # Linux-only, and licence uploads are a rare admin action - the
+    # bottleneck here is the client's network, not write syscalls.
+    # aiofiles already keeps the event loop free during disk I/O.
+    size_bytes = 0
     try:
-        with open(out_path, "wb") as f:
-            f.write(content)
+        if _HAS_AIOFILES:
+            async with aiofiles.open(out_path, "wb") as f:
+                while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+                    size_bytes += len(chunk)
+                    if size_bytes > _UPLOAD_MAX_BYTES:
+                        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+                    await f.write(chunk)
+        else:
+            # Fallback: blocking writes pushed to the default executor so
+            # the event loop keeps serving other requests
+            with open(out_path, "wb") as f:
+                while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+                    size_bytes += len(chunk)
+                    if size_bytes > _UPLOAD_MAX_BYTES:
+                        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
+                    await asyncio.to_thread(f.write, chunk)
+    except HTTPException:
+        # Drop the partial file on rejection
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
     finally:
         await file.close()
 
@@ -196,15 +275,16 @@ async def process_crisis_assessment(request: VoiceRequest):
 
     session_id = request.session_id or request.user_id
 
-    if session_id not in sessions:
-        return {"error": "No active session"}
+    with _SESSIONS_LOCK:
+        session = sessions.get(session_id)
 
-    session = sessions[session_id]
+    if session is None:
+        return {"error": "No active session"}
 
-    if "crisis_agent" not in session:
+    if not session.get("crisis_ready"):
         return {"error": "Intake not complete"}
 
-    crisis_agent = session["crisis_agent"]
+    crisis_agent = CRISIS_AGENT
     state = session["state"]
 
     # Run crisis assessment
@@ -223,6 +303,33 @@ async def process_crisis_assessment(request: VoiceRequest):
     }
 
 
+# Coalesce SDK audio chunks to roughly this size before flushing to
+# the client - fewer, larger writes without delaying first audio much
+_TTS_CHUNK_BYTES = 8192
+
+
+async def _stream_audio(audio_generator):
+    """
+    Bridge the SDK's sync chunk generator onto the event loop.
+
+    Each pull runs in a worker thread so a slow upstream read never
+    stalls other requests, and chunks are coalesced to ~8KB before
+    yielding to cut per-chunk response overhead.
+    """
+    it = iter(audio_generator)
+    buffer = bytearray()
+    while True:
+        chunk = await asyncio.to_thread(next, it, None)
+        if chunk is None:
+            break
+        buffer.extend(chunk)
+        if len(buffer) >= _TTS_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
 @app.post("/voice/tts")
 async def text_to_speech(request: Request):
     """
@@ -243,30 +350,40 @@ async def text_to_speech(request: Request):
             model_id="eleven_multilingual_v2"
         )
 
-        # Convert generator to bytes
-        audio_bytes = b''.join(audio_generator)
-
+        # Stream chunks as they arrive - playback can start after the
+        # first packet instead of waiting for the whole MP3
         return StreamingResponse(
-            iter([audio_bytes]),
+            _stream_audio(audio_generator),
             media_type="audio/mpeg"
         )
 
     except Exception as e:
-        print(f"TTS Error: {e}")
-        import traceback
-        print(traceback.format_exc())
+        # logger.exception formats the traceback lazily in the sink,
+        # not inline on the request path
+        logger.exception("TTS error")
         raise HTTPException(status_code=500, detail=f"Failed to generate speech: {str(e)}")
 
 
+# Serialized /therapists payload keyed by the db's mutation counter -
+# the roster changes only on registration/booking, so most requests
+# return pre-encoded bytes instead of re-dumping every model
+_THERAPISTS_CACHE: Optional[tuple] = None  # (db version, encoded body)
+
+
 @app.get("/therapists")
 async def list_active_therapists():
     """Return all enrolled therapists with status 'active'."""
-    all_therapists = therapist_db.get_all_therapists()
-    active = [t for t in all_therapists]
-    return {
-        "count": len(active),
-        "therapists": [t.model_dump() for t in active]
-    }
+    global _THERAPISTS_CACHE
+    version = therapist_db.version
+    if _THERAPISTS_CACHE is None or _THERAPISTS_CACHE[0] != version:
+        dumps = [t.dump_cached() for t in therapist_db.get_all_therapists()]
+        payload = {"count": len(dumps), "therapists": dumps}
+        if _HAS_ORJSON:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode()
+        _THERAPISTS_CACHE = (version, body)
+    return Response(content=_THERAPISTS_CACHE[1], media_type="application/json")
 
 
 class TherapistInput(BaseModel):
@@ -286,19 +403,32 @@ class TherapistInput(BaseModel):
     bio: Optional[str] = None
 
 
+# Id allocation state, seeded once at import - registration increments
+# a counter under a lock instead of rescanning and int-parsing every
+# id in MOCK_THERAPISTS per request
+_ID_LOCK = threading.Lock()
+_KNOWN_IDS = {str(t.get("id")) for t in MOCK_THERAPISTS}
+
+
+def _id_suffix(tid: str) -> int:
+    """Numeric suffix of a therapist_XXX id, or 0 if it has none."""
+    if tid.startswith("therapist_"):
+        suffix = tid.split("_")[1]
+        if suffix.isdigit():
+            return int(suffix)
+    return 0
+
+
+_NEXT_ID_NUM = max(map(_id_suffix, _KNOWN_IDS), default=0) + 1
+
+
 def _generate_next_therapist_id() -> str:
     """Generate a new unique therapist id of the form therapist_XXX."""
-    max_num = 0
-    for t in MOCK_THERAPISTS:
-        tid = str(t.get("id", ""))
-        if tid.startswith("therapist_"):
-            try:
-                num = int(tid.split("_")[1])
-                if num > max_num:
-                    max_num = num
-            except Exception:
-                continue
-    return f"therapist_{max_num + 1:03d}"
+    global _NEXT_ID_NUM
+    with _ID_LOCK:
+        tid = f"therapist_{_NEXT_ID_NUM:03d}"
+        _NEXT_ID_NUM += 1
+    return tid
 
 
 @app.post("/therapist")
@@ -312,9 +442,9 @@ async def register_therapist(input_data: TherapistInput):
     # Build a normalized dict with defaults/blanks
     tdict: Dict[str, Any] = {}
 
-    # Determine id and ensure uniqueness
+    # Determine id and ensure uniqueness - set probe, not a list scan
     next_id = input_data.id or _generate_next_therapist_id()
-    if any(str(t.get("id")) == str(next_id) for t in MOCK_THERAPISTS):
+    if next_id in _KNOWN_IDS:
         next_id = _generate_next_therapist_id()
     tdict["id"] = next_id
     tdict["name"] = input_data.name or ""
@@ -330,8 +460,13 @@ async def register_therapist(input_data: TherapistInput):
     tdict["current_patients"] = int(input_data.current_patients or 0)
     tdict["bio"] = input_data.bio or ""
 
-    # Append to mock backing list
+    # Append to mock backing list and record the id; a caller-chosen
+    # therapist_XXX id also advances the counter past its suffix
     MOCK_THERAPISTS.append(tdict)
+    global _NEXT_ID_NUM
+    with _ID_LOCK:
+        _KNOWN_IDS.add(next_id)
+        _NEXT_ID_NUM = max(_NEXT_ID_NUM, _id_suffix(next_id) + 1)
 
     # Try to reflect in live in-memory DB (best-effort)
     # Ensure fields are acceptable for Therapist model
@@ -343,9 +478,10 @@ async def register_therapist(input_data: TherapistInput):
 
         # Cast specializations to expected enum values (strings are fine for pydantic enums)
         therapist_obj = Therapist(**tdict_for_model)
-        # Avoid duplicates
-        if not therapist_db.get_therapist_by_id(therapist_obj.id):
-            therapist_db.therapists.append(therapist_obj)
+        # add_therapist maintains the db's id/spec/availability indexes
+        # and refuses duplicates; a bare list append would leave the new
+        # row invisible to indexed lookups
+        therapist_db.add_therapist(therapist_obj)
     except Exception as e:
         # Don't fail the API on validation errors for the in-memory DB
         print(f"Warning: Could not add therapist to in-memory DB: {e}")
@@ -361,10 +497,12 @@ async def register_therapist(input_data: TherapistInput):
 async def get_session_status(session_id: str):
     """Get current session status."""
 
-    if session_id not in sessions:
+    with _SESSIONS_LOCK:
+        session = sessions.get(session_id)
+
+    if session is None:
         return {"exists": False}
 
-    session = sessions[session_id]
     state = session["state"]
 
     return {
@@ -379,8 +517,8 @@ async def get_session_status(session_id: str):
 async def end_session(session_id: str):
     """End and cleanup session."""
 
-    if session_id in sessions:
-        del sessions[session_id]
+    with _SESSIONS_LOCK:
+        sessions.pop(session_id, None)
 
     return {"message": "Session ended"}
 
@@ -8,6 +8,21 @@ Workflows:
 - full_support: Complete user journey (crisis → resource → habit)
 """
 
+from typing import Any, Dict, List
+
 from .crisis_to_resource import create_crisis_resource_workflow
 
-__all__ = ["create_crisis_resource_workflow"]
+
+async def abatch_crisis(workflow, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run several workflow inputs as one parallel batch.
+
+    Compiled LangGraph graphs expose ``abatch``, which fans the inputs
+    out concurrently instead of awaiting them one by one - N scenarios
+    cost roughly one scenario of wall time. Used to warm LLM connection
+    pools and prompt caches before interactive traffic arrives.
+    """
+    return await workflow.abatch(inputs)
+
+
+__all__ = ["create_crisis_resource_workflow", "abatch_crisis"]
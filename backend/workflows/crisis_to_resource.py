@@ -20,15 +20,19 @@ This shows:
 KEY CONCEPT: Agents work together, each doing their specialized task!
 """
 
-from typing import TypedDict, Literal, Annotated, Optional
+import asyncio
+import os
+from typing import TypedDict, Literal, Annotated, Optional, Any, Dict, List
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langchain_core.messages import BaseMessage
 from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field
 
 from agents.crisis_agent import CrisisAgent
 from agents.resource_agent import ResourceAgent
 from agents.base_agent import AgentState
+from agents.keyword_scanner import KeywordScanner
 
 
 # ================================================================
@@ -73,6 +77,135 @@ class WorkflowState(TypedDict):
     workflow_complete: bool
 
 
+class WorkflowResult(BaseModel):
+    """
+    Immutable summary of a finished workflow run.
+
+    Callers read these fields many times per run (demo summaries, API
+    serializers); attribute access on a frozen model is cheaper than
+    repeated dict.get calls with defaults, and typo'd field names fail
+    loudly instead of silently returning the default.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    messages: List[Any] = Field(default_factory=list)
+    risk_level: str = "unknown"
+    crisis_detected: bool = False
+    coordinator_plan: List[str] = Field(default_factory=list)
+    therapist_matched: bool = False
+    matched_therapist_name: Optional[str] = None
+    habit_plan: List[Dict[str, str]] = Field(default_factory=list)
+
+
+# Ceiling on concurrently running agents across workflow invocations.
+# A single ainvoke runs its nodes sequentially, but abatch fans several
+# inputs out at once - without a bound, N batched inputs mean N agents
+# hammering the LLM and therapist APIs simultaneously. Tool-level
+# concurrency inside each agent is bounded separately by
+# TOOL_CONCURRENCY_LIMIT (see agents/base_agent.py).
+_AGENT_FANOUT = asyncio.Semaphore(int(os.getenv("WORKFLOW_MAX_PARALLEL_AGENTS", "4")))
+
+
+# One agent instance per role for the whole process. The agents are
+# stateless between calls - conversation context arrives via AgentState
+# - so instantiating them per node paid the setup cost on every
+# workflow turn (voice_api.py shares its agents the same way). Their
+# LLM clients are built lazily on first use, which keeps this module
+# importable without an API key.
+_CRISIS_AGENT = CrisisAgent()
+_RESOURCE_AGENT = ResourceAgent()
+
+
+# Overt distress phrases that predict a high-risk verdict with high
+# precision. A prescreen hit starts resource matching concurrently with
+# the crisis assessment - both are I/O-bound LLM calls, so the match's
+# latency hides almost entirely behind the assessment's.
+_DISTRESS_SCANNER = KeywordScanner(
+    {
+        "distress": [
+            "hopeless",
+            "suicid",
+            "can't go on",
+            "cant go on",
+            "end it all",
+            "end my life",
+            "no way out",
+        ]
+    }
+)
+
+# In-flight speculative matches keyed by user_id, with commit/waste
+# counters so the prescreen vocabulary can be tuned from logs. Same
+# commit-or-discard pattern as the speculative resource fetch inside
+# CrisisAgent's ReAct loop.
+_SPECULATIVE_MATCHES: Dict[str, asyncio.Task] = {}
+_SPECULATION_STATS = {"committed": 0, "wasted": 0}
+
+
+async def _match_resources(
+    messages: list,
+    user_id: str,
+    privacy_tier: str,
+    specialization: Optional[str],
+) -> tuple:
+    """
+    Run the Resource Agent once. Returns (agent_state, new_messages).
+
+    Takes a snapshot of the conversation so a speculative run is
+    isolated from messages the Crisis Agent appends while it executes.
+    """
+
+    agent_state = AgentState(
+        messages=list(messages),
+        user_id=user_id,
+        privacy_tier=privacy_tier
+    )
+    agent_state = _RESOURCE_AGENT.update_agent_data(
+        agent_state,
+        "user_needs",
+        {"specialization": specialization}
+    )
+
+    message_count = len(agent_state.messages)
+    async with _AGENT_FANOUT:
+        agent_state = await _RESOURCE_AGENT.process(agent_state)
+
+    return agent_state, list(agent_state.messages)[message_count:]
+
+
+def _discard_speculative_match(task: asyncio.Task) -> None:
+    """Cancel an uncommitted speculative match and count the waste."""
+
+    if not task.cancel():
+        # Already finished - retrieve any exception so the loop
+        # doesn't warn about it being unobserved
+        task.exception()
+    _SPECULATION_STATS["wasted"] += 1
+    logger.info(
+        "⚡ Speculative match discarded | committed={} wasted={}",
+        _SPECULATION_STATS["committed"],
+        _SPECULATION_STATS["wasted"],
+    )
+
+
+# Stage headers are a single record by default; the decorative "=" * 70
+# frames cost three formatted records apiece and add up fast under
+# batch traffic. MINDBRIDGE_VERBOSE_LOGS=1 brings the frames back.
+_BANNER = "=" * 70
+_VERBOSE_LOGS = os.getenv("MINDBRIDGE_VERBOSE_LOGS", "").lower() in ("1", "true", "yes")
+
+
+def _log_stage(header: str) -> None:
+    """Log a workflow stage header, framed only in verbose mode."""
+    if _VERBOSE_LOGS:
+        logger.info(_BANNER)
+        logger.info(header)
+        logger.info(_BANNER)
+    else:
+        logger.info(header)
+
+
 # ================================================================
 # AGENT NODE FUNCTIONS
 # ================================================================
@@ -92,12 +225,28 @@ async def crisis_assessment_node(state: WorkflowState) -> WorkflowState:
     LangGraph then decides where to route next based on the state!
     """
 
-    logger.info("=" * 70)
-    logger.info("🚨 WORKFLOW: Crisis Assessment Starting")
-    logger.info("=" * 70)
-
-    # Create Crisis Agent
-    crisis_agent = CrisisAgent()
+    _log_stage("🚨 WORKFLOW: Crisis Assessment Starting")
+
+    # Speculative resource matching: when the user's own words carry
+    # overt distress signals, start the match now instead of waiting
+    # for the assessment to confirm what the prescreen already predicts.
+    # resource_matching_node commits the result only if the predicted
+    # risk holds; otherwise it is discarded and counted.
+    stale = _SPECULATIVE_MATCHES.pop(state["user_id"], None)
+    if stale is not None:
+        _discard_speculative_match(stale)
+
+    last_user_message = state["messages"][-1].content if state["messages"] else ""
+    if _DISTRESS_SCANNER.contains_any(last_user_message.lower()):
+        logger.info("⚡ Distress prescreen hit - speculatively starting resource match")
+        _SPECULATIVE_MATCHES[state["user_id"]] = asyncio.create_task(
+            _match_resources(
+                state["messages"],
+                state["user_id"],
+                state["privacy_tier"],
+                "trauma",  # the prescreen vocabulary predicts high risk
+            )
+        )
 
     # Convert workflow state to agent state
     agent_state = AgentState(
@@ -106,36 +255,31 @@ async def crisis_assessment_node(state: WorkflowState) -> WorkflowState:
         privacy_tier=state["privacy_tier"]
     )
 
-    # Run Crisis Agent (this does ReAct assessment)
-    agent_state = await crisis_agent.process(agent_state)
-
-    # Prefer structured insight from Crisis Agent (populated during tool calls)
-    risk_level = agent_state.agent_data.get("risk_level")
+    # Run Crisis Agent (this does ReAct assessment). The length is
+    # snapshotted BEFORE the agent runs so the delta slice below stays
+    # correct even if the agent appends to the list in place.
+    message_count = len(state["messages"])
+    async with _AGENT_FANOUT:
+        agent_state = await _CRISIS_AGENT.process(agent_state)
+
+    # Structured insight from the Crisis Agent (populated during tool
+    # calls). The agent finalizes risk_level and crisis_detected itself
+    # - including the keyword fallback when the planner skipped the
+    # assessment tool - so the node just reads the verdict.
+    risk_level = agent_state.agent_data.get("risk_level", "none")
     escalation = agent_state.agent_data.get("escalation_recommendation", {})
     needs_resource = agent_state.agent_data.get("needs_resource_agent", False)
     needs_emergency = agent_state.agent_data.get("needs_emergency_services", False)
+    crisis_detected = agent_state.agent_data.get("crisis_detected", False)
 
-    if not risk_level:
-        response_text = agent_state.messages[-1].content.lower() if agent_state.messages else ""
-        if any(word in response_text for word in ["immediate", "emergency", "911"]):
-            risk_level = "immediate"
-        elif any(word in response_text for word in ["high priority", "therapist", "connect you"]):
-            risk_level = "high"
-        elif any(word in response_text for word in ["moderate", "check-in", "follow up"]):
-            risk_level = "moderate"
-        elif any(word in response_text for word in ["low", "stressed", "support"]):
-            risk_level = "low"
-        else:
-            risk_level = "none"
+    logger.info("🎯 Crisis Assessment Complete: Risk Level = {}", risk_level)
 
-    crisis_detected = risk_level in ["moderate", "high", "immediate"] or needs_resource or needs_emergency
-
-    logger.info(f"🎯 Crisis Assessment Complete: Risk Level = {risk_level}")
-
-    # Update workflow state
+    # Return only the delta - LangGraph merges partial updates through
+    # the state reducers, so spreading the whole state back just copied
+    # every field per node. Messages carry only the agent's additions;
+    # the add_messages reducer appends them to the channel.
     return {
-        **state,
-        "messages": agent_state.messages,
+        "messages": list(agent_state.messages)[message_count:],
         "risk_level": risk_level,
         "crisis_detected": crisis_detected,
         "needs_resource_agent": needs_resource,
@@ -156,34 +300,35 @@ async def resource_matching_node(state: WorkflowState) -> WorkflowState:
     4. Returns updated state
     """
 
-    logger.info("=" * 70)
-    logger.info("🔍 WORKFLOW: Resource Matching Starting")
-    logger.info("=" * 70)
-
-    # Create Resource Agent
-    resource_agent = ResourceAgent()
-
-    # Convert workflow state to agent state
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
-
-    # Add user needs based on crisis assessment
-    # In production, this would be more sophisticated
-    specialization = None
-    if state.get("risk_level") in ["high", "immediate"]:
-        specialization = "trauma"  # High-risk cases need trauma specialists
+    _log_stage("🔍 WORKFLOW: Resource Matching Starting")
 
-    agent_state = resource_agent.update_agent_data(
-        agent_state,
-        "user_needs",
-        {"specialization": specialization}
-    )
+    high_risk = state.get("risk_level") in ["high", "immediate"]
 
-    # Run Resource Agent (this does autonomous search if needed)
-    agent_state = await resource_agent.process(agent_state)
+    task = _SPECULATIVE_MATCHES.pop(state["user_id"], None)
+    if task is not None and high_risk:
+        # Prediction confirmed: the match ran while the Crisis Agent
+        # was still assessing, so its latency is already paid
+        agent_state, new_messages = await task
+        _SPECULATION_STATS["committed"] += 1
+        logger.info(
+            "⚡ Speculative match committed | committed={} wasted={}",
+            _SPECULATION_STATS["committed"],
+            _SPECULATION_STATS["wasted"],
+        )
+    else:
+        if task is not None:
+            # Risk came back lower than the prescreen predicted; the
+            # speculative run assumed a trauma specialization, so rerun
+            # with the actual needs instead of committing a mismatch
+            _discard_speculative_match(task)
+
+        # High-risk cases need trauma specialists
+        agent_state, new_messages = await _match_resources(
+            state["messages"],
+            state["user_id"],
+            state["privacy_tier"],
+            "trauma" if high_risk else None,
+        )
 
     # Extract matching results
     matched_therapist = agent_state.agent_data.get("matched_therapist")
@@ -192,16 +337,13 @@ async def resource_matching_node(state: WorkflowState) -> WorkflowState:
     therapist_id = matched_therapist.get("id") if matched_therapist else None
     therapist_name = matched_therapist.get("name") if matched_therapist else None
 
-    logger.info(
-        f"🎯 Resource Matching Complete: Match Found = {therapist_matched}"
-    )
+    logger.info("🎯 Resource Matching Complete: Match Found = {}", therapist_matched)
     if therapist_name:
-        logger.info(f"   Matched with: {therapist_name}")
+        logger.info("   Matched with: {}", therapist_name)
 
-    # Update workflow state
+    # Delta update only - new messages plus the fields this node owns
     return {
-        **state,
-        "messages": agent_state.messages,
+        "messages": new_messages,
         "therapist_matched": therapist_matched,
         "matched_therapist_id": therapist_id,
         "matched_therapist_name": therapist_name,
@@ -218,9 +360,12 @@ async def support_resources_node(state: WorkflowState) -> WorkflowState:
     For demo purposes, we just log this step.
     """
 
-    logger.info("=" * 70)
-    logger.info("💚 WORKFLOW: Providing Support Resources (No Crisis)")
-    logger.info("=" * 70)
+    _log_stage("💚 WORKFLOW: Providing Support Resources (No Crisis)")
+
+    # No crisis confirmed - any speculative match is a misprediction
+    task = _SPECULATIVE_MATCHES.pop(state["user_id"], None)
+    if task is not None:
+        _discard_speculative_match(task)
 
     # In production, this would provide:
     # - Self-help resources
@@ -231,7 +376,6 @@ async def support_resources_node(state: WorkflowState) -> WorkflowState:
     logger.info("✅ Support resources provided")
 
     return {
-        **state,
         "needs_resource_agent": False,
         "workflow_complete": True
     }
@@ -307,14 +451,10 @@ def create_crisis_resource_workflow():
     workflow.add_edge(START, "crisis_assessment")
 
     # crisis_assessment → ??? (conditional routing!)
-    workflow.add_conditional_edges(
-        "crisis_assessment",
-        route_after_crisis,
-        {
-            "resource_matching": "resource_matching",
-            "support_resources": "support_resources"
-        }
-    )
+    # route_after_crisis returns the target node name itself and its
+    # Literal annotation declares the possible edges, so the identity
+    # path-map dict (and its lookup on every transition) is unnecessary
+    workflow.add_conditional_edges("crisis_assessment", route_after_crisis)
 
     # Both paths → END
     workflow.add_edge("resource_matching", END)
@@ -334,6 +474,37 @@ def create_crisis_resource_workflow():
 # CONVENIENCE FUNCTION
 # ================================================================
 
+# Fixed starting values for a run, allocated once at import. Each call
+# copies this and fills in the three per-request fields rather than
+# rebuilding the full literal dict per invocation.
+_INITIAL_STATE_DEFAULTS: WorkflowState = {
+    "risk_level": None,
+    "crisis_detected": False,
+    "needs_resource_agent": False,
+    "needs_emergency_services": False,
+    "escalation_recommendation": None,
+    "therapist_matched": False,
+    "matched_therapist_id": None,
+    "matched_therapist_name": None,
+    "next_step": None,
+    "workflow_complete": False
+}
+
+
+# Compiled graph singleton - construction allocates Pregel channels and
+# validates the schema, and the graph is immutable once built, so the
+# per-call rebuild in run_crisis_resource_workflow was pure overhead
+_COMPILED_WORKFLOW = None
+
+
+def _get_workflow():
+    """Build the compiled workflow once and reuse it."""
+    global _COMPILED_WORKFLOW
+    if _COMPILED_WORKFLOW is None:
+        _COMPILED_WORKFLOW = create_crisis_resource_workflow()
+    return _COMPILED_WORKFLOW
+
+
 async def run_crisis_resource_workflow(
     user_message: str,
     user_id: str = "demo_user",
@@ -350,53 +521,47 @@ async def run_crisis_resource_workflow(
         privacy_tier: Privacy level
 
     Returns:
-        Final workflow state with all agent results
+        WorkflowResult summarizing the final workflow state
     """
 
     from langchain_core.messages import HumanMessage
 
-    logger.info("=" * 70)
-    logger.info("🚀 STARTING MULTI-AGENT WORKFLOW")
-    logger.info("=" * 70)
-    logger.info(f"User Message: {user_message}")
-    logger.info(f"User ID: {user_id}")
-    logger.info(f"Privacy Tier: {privacy_tier}")
-    logger.info("=" * 70)
-
-    # Create workflow
-    workflow = create_crisis_resource_workflow()
-
-    # Initialize state
-    initial_state: WorkflowState = {
-        "messages": [HumanMessage(content=user_message)],
-        "user_id": user_id,
-        "privacy_tier": privacy_tier,
-        "risk_level": None,
-        "crisis_detected": False,
-        "needs_resource_agent": False,
-        "needs_emergency_services": False,
-        "escalation_recommendation": None,
-        "therapist_matched": False,
-        "matched_therapist_id": None,
-        "matched_therapist_name": None,
-        "next_step": None,
-        "workflow_complete": False
-    }
+    _log_stage("🚀 STARTING MULTI-AGENT WORKFLOW")
+    logger.info("User: {} | Tier: {} | Message: {}", user_id, privacy_tier, user_message)
+
+    # Reuse the compiled workflow - state is passed per invocation, the
+    # graph itself never changes
+    workflow = _get_workflow()
+
+    # Initialize state: shared defaults + the per-request fields
+    initial_state: WorkflowState = dict(_INITIAL_STATE_DEFAULTS)
+    initial_state.update(
+        messages=[HumanMessage(content=user_message)],
+        user_id=user_id,
+        privacy_tier=privacy_tier,
+    )
 
     # Run workflow (LangGraph handles the orchestration!)
     final_state = await workflow.ainvoke(initial_state)
 
-    logger.info("=" * 70)
-    logger.info("✅ WORKFLOW COMPLETE")
-    logger.info("=" * 70)
-    logger.info(f"Risk Level: {final_state.get('risk_level')}")
-    logger.info(f"Crisis Detected: {final_state.get('crisis_detected')}")
-    logger.info(f"Therapist Matched: {final_state.get('therapist_matched')}")
-    if final_state.get('matched_therapist_name'):
-        logger.info(f"Matched With: {final_state.get('matched_therapist_name')}")
-    logger.info("=" * 70)
+    _log_stage("✅ WORKFLOW COMPLETE")
+    logger.info(
+        "Result | risk={} crisis={} matched={} therapist={}",
+        final_state.get("risk_level"),
+        final_state.get("crisis_detected"),
+        final_state.get("therapist_matched"),
+        final_state.get("matched_therapist_name"),
+    )
 
-    return final_state
+    return WorkflowResult(
+        messages=final_state.get("messages", []),
+        risk_level=final_state.get("risk_level") or "unknown",
+        crisis_detected=bool(final_state.get("crisis_detected", False)),
+        coordinator_plan=final_state.get("coordinator_plan") or [],
+        therapist_matched=bool(final_state.get("therapist_matched", False)),
+        matched_therapist_name=final_state.get("matched_therapist_name"),
+        habit_plan=final_state.get("habit_plan") or [],
+    )
 
 
 # ================================================================
@@ -423,9 +588,9 @@ if __name__ == "__main__":
         )
 
         print("\n📊 Result:")
-        print(f"   Messages exchanged: {len(result['messages'])}")
-        print(f"   Risk level: {result['risk_level']}")
-        print(f"   Therapist matched: {result['therapist_matched']}")
+        print(f"   Messages exchanged: {len(result.messages)}")
+        print(f"   Risk level: {result.risk_level}")
+        print(f"   Therapist matched: {result.therapist_matched}")
 
         await asyncio.sleep(2)
 
@@ -440,9 +605,9 @@ if __name__ == "__main__":
         )
 
         print("\n📊 Result:")
-        print(f"   Messages exchanged: {len(result['messages'])}")
-        print(f"   Risk level: {result['risk_level']}")
-        print(f"   Therapist matched: {result['therapist_matched']}")
+        print(f"   Messages exchanged: {len(result.messages)}")
+        print(f"   Risk level: {result.risk_level}")
+        print(f"   Therapist matched: {result.therapist_matched}")
 
         print("\n" + "=" * 70)
         print("✅ Workflow Tests Complete!")
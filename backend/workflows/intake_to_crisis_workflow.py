@@ -18,10 +18,13 @@ This creates a HUMAN-LIKE experience:
 - Then provides appropriate support
 """
 
+import asyncio
+import os
 from typing import TypedDict, Literal, Annotated, Optional, Dict
 from langgraph.graph import StateGraph, START, END
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph.message import add_messages
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from loguru import logger
 
 from agents.coordinator_agent import CoordinatorAgent
@@ -32,6 +35,57 @@ from agents.habit_agent import HabitAgent
 from agents.base_agent import AgentState
 
 
+# Bounds how many agent runs this workflow launches at once. The habit
+# overlap below and parallel demo scenarios can otherwise stack LLM
+# calls past the provider rate limit.
+_AGENT_FANOUT = asyncio.Semaphore(int(os.getenv("WORKFLOW_MAX_PARALLEL_AGENTS", "4")))
+
+
+# Canned reply for immediate-risk turns. Sent verbatim, with no further
+# agent round trips - when someone needs emergency services, the last
+# thing the pipeline should add is another LLM call's worth of latency.
+EMERGENCY_RESPONSE_TEMPLATE = (
+    "I'm really concerned about your safety right now. Please reach out "
+    "for immediate help:\n\n"
+    "• Call or text 988 (Suicide & Crisis Lifeline, available 24/7)\n"
+    "• Call 911 if you are in immediate danger\n"
+    "• Text HOME to 741741 (Crisis Text Line)\n\n"
+    "You don't have to go through this alone - trained counselors are "
+    "ready to talk with you right now."
+)
+
+
+# Shared agent instances - agents keep no per-conversation state
+# (everything lives in AgentState), so one of each serves every run.
+# Constructing them inside the nodes logged a startup banner on every
+# single turn. Same pattern as the API-layer singletons in
+# voice_api.py. LLM clients are built lazily on first use, so these
+# constructors - and importing this module - need no API key.
+_COORDINATOR = CoordinatorAgent()
+_INTAKE_AGENT = IntakeAgent()
+_CRISIS_AGENT = CrisisAgent()
+_RESOURCE_AGENT = ResourceAgent()
+_HABIT_AGENT = HabitAgent()
+
+
+# The three-line "=" frame around every node header added ~15 formatted
+# log records per turn at INFO - real serialization cost under load.
+# Default is one header line per stage; MINDBRIDGE_VERBOSE_LOGS=1
+# restores the frames for demo sessions.
+_BANNER = "=" * 70
+_VERBOSE_LOGS = os.getenv("MINDBRIDGE_VERBOSE_LOGS", "").lower() in ("1", "true", "yes")
+
+
+def _log_stage(header: str) -> None:
+    """Log a workflow stage header, framed only in verbose mode."""
+    if _VERBOSE_LOGS:
+        logger.info(_BANNER)
+        logger.info(header)
+        logger.info(_BANNER)
+    else:
+        logger.info(header)
+
+
 # ================================================================
 # WORKFLOW STATE
 # ================================================================
@@ -41,6 +95,14 @@ class WorkflowState(TypedDict):
     State that flows through the entire workflow.
 
     Now includes intake stage tracking!
+
+    PERFORMANCE NOTE: swapping this TypedDict for a slotted dataclass
+    or frozen pydantic model was evaluated and turned down. The copy
+    cost that motivated it disappeared when nodes switched to delta
+    returns (no more {**state} spreads), TypedDict keys are interned
+    strings so channel lookups are cheap, and a pydantic state would
+    make LangGraph validate the model on every node hop - paying per
+    transition to save nothing.
     """
 
     # Conversation messages
@@ -50,6 +112,11 @@ class WorkflowState(TypedDict):
     user_id: str
     privacy_tier: str
 
+    # Shared agent working memory, carried across nodes so context one
+    # agent records (coordinator plan, risk assessment) reaches the
+    # next without per-field re-plumbing
+    agent_data: Optional[Dict]
+
     # Intake stage tracking
     intake_complete: bool
     intake_stage: Optional[str]
@@ -79,6 +146,33 @@ class WorkflowState(TypedDict):
 # ================================================================
 
 
+# Coordinator routing is a pure function of the latest user message, so
+# retries and replays of the same turn can skip the agent run entirely.
+# Keyed per user so plans never leak across sessions; bounded FIFO like
+# the agents' local tool caches. Intake is deliberately NOT memoized -
+# its output is a stage-dependent conversational reply, not a
+# classification.
+_COORDINATOR_MEMO: Dict[tuple, dict] = {}
+_COORDINATOR_MEMO_MAX = 256
+
+
+def _agent_state(state: WorkflowState) -> AgentState:
+    """
+    Build the AgentState for one node run.
+
+    Construction itself is near-free (AgentState is a msgspec struct);
+    the point of the shared helper is seeding agent_data from the
+    workflow state so each agent sees what the previous ones recorded.
+    """
+
+    return AgentState(
+        messages=state["messages"],
+        user_id=state["user_id"],
+        privacy_tier=state["privacy_tier"],
+        agent_data=dict(state.get("agent_data") or {}),
+    )
+
+
 async def coordinator_node(state: WorkflowState) -> WorkflowState:
     """
     Coordinator Node - Decides which specialists engage first.
@@ -86,20 +180,37 @@ async def coordinator_node(state: WorkflowState) -> WorkflowState:
     This makes the orchestration explicit: the Coordinator inspects the
     most recent user message, determines whether to start with Intake or
     Crisis Agent, and flags whether Habit Agent should follow later.
+
+    PERFORMANCE NOTE: fusing coordinator + intake into one combined LLM
+    prompt for the first turn was evaluated and dropped. The Coordinator
+    makes no LLM call - routing is a keyword-automaton scan measured in
+    microseconds (see agents/coordinator_agent.py) - so turn one already
+    pays exactly one LLM round trip, the intake reply. A fused prompt
+    would fold that scan into the intake call for no latency win while
+    coupling the two agents' prompts and output parsing.
     """
 
-    logger.info("=" * 70)
-    logger.info("🎯 WORKFLOW: Coordinator evaluating next steps")
-    logger.info("=" * 70)
+    _log_stage("🎯 WORKFLOW: Coordinator evaluating next steps")
+
+    last_user_message = state["messages"][-1].content if state["messages"] else ""
+    memo_key = (state["user_id"], last_user_message)
+    cached = _COORDINATOR_MEMO.get(memo_key)
+    if cached is not None:
+        logger.info("🧭 Coordinator decision served from memo")
+        return {
+            "messages": [AIMessage(content=cached["summary"])],
+            "next_step": cached["next_step"],
+            "needs_habit_support": cached["needs_habit_support"],
+            "coordinator_plan": cached["coordinator_plan"],
+        }
 
-    coordinator = CoordinatorAgent()
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
+    agent_state = _agent_state(state)
 
-    agent_state = await coordinator.process(agent_state)
+    # Length snapshotted BEFORE the agent runs so the delta slice stays
+    # correct even if the agent appends to the list in place (the same
+    # invariant holds in every node below)
+    message_count = len(state["messages"])
+    agent_state = await _COORDINATOR.process(agent_state)
 
     initial_route = agent_state.agent_data.get("initial_route", "intake")
     needs_habit_support = agent_state.agent_data.get("needs_habit_support", False)
@@ -114,9 +225,24 @@ async def coordinator_node(state: WorkflowState) -> WorkflowState:
         }
     )
 
+    new_messages = list(agent_state.messages)[message_count:]
+
+    # Remember the decision for replays of this turn
+    if len(_COORDINATOR_MEMO) >= _COORDINATOR_MEMO_MAX:
+        _COORDINATOR_MEMO.pop(next(iter(_COORDINATOR_MEMO)))
+    _COORDINATOR_MEMO[memo_key] = {
+        "summary": new_messages[-1].content if new_messages else "",
+        "next_step": initial_route,
+        "needs_habit_support": needs_habit_support,
+        "coordinator_plan": plan_steps,
+    }
+
+    # Delta update only - LangGraph merges partial returns via the
+    # state reducers; spreading the full state back copied every field
+    # per node and re-sent old messages through add_messages
     return {
-        **state,
-        "messages": agent_state.messages,
+        "messages": new_messages,
+        "agent_data": agent_state.agent_data,
         "next_step": initial_route,
         "needs_habit_support": needs_habit_support,
         "coordinator_plan": plan_steps,
@@ -136,36 +262,28 @@ async def intake_node(state: WorkflowState) -> WorkflowState:
     6. Marks intake complete when ready
     """
 
-    logger.info("=" * 70)
-    logger.info("🤝 WORKFLOW: Intake Conversation Starting")
-    logger.info("=" * 70)
-
-    # Create Intake Agent
-    intake_agent = IntakeAgent()
+    _log_stage("🤝 WORKFLOW: Intake Conversation Starting")
 
     # Convert workflow state to agent state
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
+    agent_state = _agent_state(state)
 
     # Add intake stage from workflow state
     if state.get("intake_stage"):
         agent_state.agent_data["intake_stage"] = state["intake_stage"]
 
     # Run Intake Agent
-    agent_state = await intake_agent.process(agent_state)
+    message_count = len(state["messages"])
+    agent_state = await _INTAKE_AGENT.process(agent_state)
 
     # Check if intake is complete
-    intake_complete = intake_agent.should_proceed_to_crisis_assessment(agent_state)
+    intake_complete = _INTAKE_AGENT.should_proceed_to_crisis_assessment(agent_state)
 
-    logger.info(f"🎯 Intake Status: {'Complete ✅' if intake_complete else 'Ongoing 🔄'}")
+    logger.info("🎯 Intake Status: {}", "Complete ✅" if intake_complete else "Ongoing 🔄")
 
-    # Update workflow state
+    # Delta update only
     return {
-        **state,
-        "messages": agent_state.messages,
+        "messages": list(agent_state.messages)[message_count:],
+        "agent_data": agent_state.agent_data,
         "intake_complete": intake_complete,
         "intake_stage": agent_state.agent_data.get("intake_stage"),
         "next_step": "crisis_assessment" if intake_complete else "intake"
@@ -180,87 +298,103 @@ async def crisis_assessment_node(state: WorkflowState) -> WorkflowState:
     gathered during the friendly conversation.
     """
 
-    logger.info("=" * 70)
-    logger.info("🚨 WORKFLOW: Crisis Assessment Starting")
-    logger.info("=" * 70)
-
-    # Create Crisis Agent
-    crisis_agent = CrisisAgent()
+    _log_stage("🚨 WORKFLOW: Crisis Assessment Starting")
 
     # Convert workflow state to agent state
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
+    agent_state = _agent_state(state)
 
     # Run Crisis Agent (this does ReAct assessment)
-    agent_state = await crisis_agent.process(agent_state)
-
-    # Extract crisis level from agent's analysis
-    response_text = agent_state.messages[-1].content.lower() if agent_state.messages else ""
-
-    # Simple risk detection (in production, would be more sophisticated)
-    if any(word in response_text for word in ["immediate", "emergency", "911"]):
-        risk_level = "immediate"
-        crisis_detected = True
-    elif any(word in response_text for word in ["high priority", "therapist", "connect you"]):
-        risk_level = "high"
-        crisis_detected = True
-    elif any(word in response_text for word in ["moderate", "check-in", "follow up"]):
-        risk_level = "moderate"
-        crisis_detected = True
-    elif any(word in response_text for word in ["low", "stressed", "support"]):
-        risk_level = "low"
-        crisis_detected = False
-    else:
-        risk_level = "none"
-        crisis_detected = False
+    message_count = len(state["messages"])
+    agent_state = await _CRISIS_AGENT.process(agent_state)
 
-    logger.info(f"🎯 Crisis Assessment Complete: Risk Level = {risk_level}")
+    # The final verdict (including the keyword fallback when the
+    # planner skipped the assessment tool) is computed once inside
+    # CrisisAgent.process - the node just reads it
+    risk_level = agent_state.agent_data.get("risk_level", "none")
+    crisis_detected = agent_state.agent_data.get("crisis_detected", False)
 
-    # Update workflow state
+    logger.info("🎯 Crisis Assessment Complete: Risk Level = {}", risk_level)
+
+    # Delta update only
     return {
-        **state,
-        "messages": agent_state.messages,
+        "messages": list(agent_state.messages)[message_count:],
+        "agent_data": agent_state.agent_data,
         "risk_level": risk_level,
         "crisis_detected": crisis_detected,
         "next_step": "resource_matching" if crisis_detected else "support_resources"
     }
 
 
+async def _run_habit_agent(state: WorkflowState) -> tuple:
+    """
+    Run the Habit Agent against the current conversation.
+
+    Returns the messages it added and the habit plan it produced.
+    Shared by the resource-matching overlap and the support path - the
+    plan depends only on the conversation and coordinator hints, never
+    on the matching outcome.
+    """
+
+    agent_state = _agent_state(state)
+    # Private copy of the history - this can run concurrently with the
+    # Resource Agent, which appends to its own view of the messages
+    agent_state.messages = list(agent_state.messages)
+
+    # Pass contextual hints from coordinator if available
+    if state.get("coordinator_plan"):
+        agent_state = _HABIT_AGENT.update_agent_data(
+            agent_state,
+            "coordinator_plan",
+            state["coordinator_plan"]
+        )
+
+    message_count = len(agent_state.messages)
+    async with _AGENT_FANOUT:
+        agent_state = await _HABIT_AGENT.process(agent_state)
+
+    new_messages = list(agent_state.messages)[message_count:]
+    return new_messages, agent_state.agent_data.get("habit_plan")
+
+
 async def resource_matching_node(state: WorkflowState) -> WorkflowState:
     """
     Resource Matching Node - Finds therapist for user.
-    """
 
-    logger.info("=" * 70)
-    logger.info("🔍 WORKFLOW: Resource Matching Starting")
-    logger.info("=" * 70)
+    When the Coordinator has already flagged habit support, the Habit
+    Agent runs here concurrently with resource matching: the two are
+    independent (the habit plan never reads the match result), so the
+    sequential habit_support hop would just add its full latency.
+    """
 
-    # Create Resource Agent
-    resource_agent = ResourceAgent()
+    _log_stage("🔍 WORKFLOW: Resource Matching Starting")
 
     # Convert workflow state to agent state
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
+    agent_state = _agent_state(state)
 
     # Add user needs based on crisis assessment
     specialization = None
     if state.get("risk_level") in ["high", "immediate"]:
         specialization = "trauma"  # High-risk cases need trauma specialists
 
-    agent_state = resource_agent.update_agent_data(
+    agent_state = _RESOURCE_AGENT.update_agent_data(
         agent_state,
         "user_needs",
         {"specialization": specialization}
     )
 
-    # Run Resource Agent
-    agent_state = await resource_agent.process(agent_state)
+    needs_habit_support = state.get("needs_habit_support", False)
+    message_count = len(state["messages"])
+
+    # Run Resource Agent - with the Habit Agent alongside when needed
+    if needs_habit_support:
+        logger.info("📈 Overlapping Habit Agent with resource matching")
+        agent_state, (habit_messages, habit_plan) = await asyncio.gather(
+            _RESOURCE_AGENT.process(agent_state),
+            _run_habit_agent(state)
+        )
+    else:
+        agent_state = await _RESOURCE_AGENT.process(agent_state)
+        habit_messages, habit_plan = [], None
 
     # Extract matching results
     matched_therapist = agent_state.agent_data.get("matched_therapist")
@@ -269,73 +403,61 @@ async def resource_matching_node(state: WorkflowState) -> WorkflowState:
     therapist_id = matched_therapist.get("id") if matched_therapist else None
     therapist_name = matched_therapist.get("name") if matched_therapist else None
 
-    logger.info(f"🎯 Resource Matching Complete: Match Found = {therapist_matched}")
+    logger.info("🎯 Resource Matching Complete: Match Found = {}", therapist_matched)
     if therapist_name:
-        logger.info(f"   Matched with: {therapist_name}")
+        logger.info("   Matched with: {}", therapist_name)
 
-    # Update workflow state
-    return {
-        **state,
-        "messages": agent_state.messages,
+    # Delta update only - the agents' new messages (plus any from the
+    # overlapped habit run) and the fields this node owns
+    result = {
+        "messages": list(agent_state.messages)[message_count:] + habit_messages,
+        "agent_data": agent_state.agent_data,
         "therapist_matched": therapist_matched,
         "matched_therapist_id": therapist_id,
         "matched_therapist_name": therapist_name,
-        "workflow_complete": not state.get("needs_habit_support", False)
+        "workflow_complete": True
     }
 
+    if needs_habit_support:
+        # Habit plan arrived with the match
+        result.update({
+            "habit_plan_created": True,
+            "needs_habit_support": False,
+            "habit_plan": habit_plan,
+        })
+
+    return result
+
 
 async def support_resources_node(state: WorkflowState) -> WorkflowState:
     """
     Support Resources Node - For low/no risk cases.
+
+    Habit planning runs inline here when the Coordinator flagged it.
+    This node has no I/O of its own, so a separate sequential
+    habit_support hop after it only added a graph-scheduling round
+    trip before the same Habit Agent call.
     """
 
-    logger.info("=" * 70)
-    logger.info("💚 WORKFLOW: Providing Support Resources (No Crisis)")
-    logger.info("=" * 70)
+    _log_stage("💚 WORKFLOW: Providing Support Resources (No Crisis)")
 
     logger.info("✅ Support resources provided")
 
-    return {
-        **state,
-        "workflow_complete": not state.get("needs_habit_support", False)
+    result = {
+        "workflow_complete": True
     }
 
+    if state.get("needs_habit_support"):
+        logger.info("📈 Habit Agent providing follow-up plan")
+        habit_messages, habit_plan = await _run_habit_agent(state)
+        result.update({
+            "messages": habit_messages,
+            "habit_plan_created": True,
+            "needs_habit_support": False,
+            "habit_plan": habit_plan,
+        })
 
-async def habit_support_node(state: WorkflowState) -> WorkflowState:
-    """
-    Habit Support Node - Suggests supportive routines after escalation.
-    """
-
-    logger.info("=" * 70)
-    logger.info("📈 WORKFLOW: Habit Agent providing follow-up plan")
-    logger.info("=" * 70)
-
-    habit_agent = HabitAgent()
-    agent_state = AgentState(
-        messages=state["messages"],
-        user_id=state["user_id"],
-        privacy_tier=state["privacy_tier"]
-    )
-
-    # Pass contextual hints from coordinator if available
-    if state.get("coordinator_plan"):
-        agent_state = habit_agent.update_agent_data(
-            agent_state,
-            "coordinator_plan",
-            state["coordinator_plan"]
-        )
-
-    agent_state = await habit_agent.process(agent_state)
-    habit_plan = agent_state.agent_data.get("habit_plan")
-
-    return {
-        **state,
-        "messages": agent_state.messages,
-        "habit_plan_created": True,
-        "needs_habit_support": False,
-        "habit_plan": habit_plan,
-        "workflow_complete": True
-    }
+    return result
 
 
 # ================================================================
@@ -389,37 +511,11 @@ def route_after_crisis(state: WorkflowState) -> Literal["resource_matching", "su
         return "support_resources"
 
 
-def route_after_resource(state: WorkflowState) -> Literal["habit_support", "end"]:
-    """
-    Decide whether to add Habit Agent after resource matching.
-    """
-
-    if state.get("needs_habit_support"):
-        logger.info("🔀 ROUTING: Queue Habit Agent for follow-up")
-        return "habit_support"
-
-    logger.info("🔀 ROUTING: No habit support needed → End workflow")
-    return "end"
-
-
-def route_after_support(state: WorkflowState) -> Literal["habit_support", "end"]:
-    """
-    Decide whether to offer habits after support resources.
-    """
-
-    if state.get("needs_habit_support"):
-        logger.info("🔀 ROUTING: Support resources delivered → Habit Agent next")
-        return "habit_support"
-
-    logger.info("🔀 ROUTING: Support resources complete → End workflow")
-    return "end"
-
-
 # ================================================================
 # WORKFLOW CREATION
 # ================================================================
 
-def create_intake_crisis_workflow():
+def create_intake_crisis_workflow(checkpointer=None):
     """
     Create the Intake → Crisis → Resource workflow.
 
@@ -441,12 +537,12 @@ def create_intake_crisis_workflow():
       ↓          ↓
     [Resource   [Support
      Matching]   Resources]
-          ↓          ↓
-    {Habits?}    {Habits?}
-      ↓  ↓         ↓   ↓
-    YES  NO      YES  NO
-      ↓   ↓        ↓   ↓
-    [Habit] END  [Habit] END
+      ↓          ↓
+    END         END
+
+    Habit planning no longer has its own hop: when the Coordinator
+    flags it, the Habit Agent runs concurrently with resource matching
+    (crisis path) or inline with support resources (no-crisis path).
     """
 
     logger.info("🏗️  Building Intake → Crisis → Resource workflow...")
@@ -460,71 +556,37 @@ def create_intake_crisis_workflow():
     workflow.add_node("crisis_assessment", crisis_assessment_node)
     workflow.add_node("resource_matching", resource_matching_node)
     workflow.add_node("support_resources", support_resources_node)
-    workflow.add_node("habit_support", habit_support_node)
 
     # Add edges
 
     # START → coordinator
     workflow.add_edge(START, "coordinator")
 
-    # coordinator → intake or crisis
-    workflow.add_conditional_edges(
-        "coordinator",
-        route_after_coordinator,
-        {
-            "intake": "intake",
-            "crisis_assessment": "crisis_assessment",
-        }
-    )
-
-    # intake → ??? (conditional: continue intake OR proceed to crisis)
-    workflow.add_conditional_edges(
-        "intake",
-        route_after_intake,
-        {
-            "intake": "intake",  # Loop back for more conversation
-            "crisis_assessment": "crisis_assessment"
-        }
-    )
+    # The routers return target node names directly (their Literal
+    # annotations declare the possible edges), so no path-map dict is
+    # needed - the identity mappings were a per-transition dict lookup
+    # that only restated what the router already said.
 
-    # crisis_assessment → ??? (conditional routing)
-    workflow.add_conditional_edges(
-        "crisis_assessment",
-        route_after_crisis,
-        {
-            "resource_matching": "resource_matching",
-            "support_resources": "support_resources"
-        }
-    )
+    # coordinator → intake or crisis
+    workflow.add_conditional_edges("coordinator", route_after_coordinator)
 
-    # resource_matching → habit support or END
-    workflow.add_conditional_edges(
-        "resource_matching",
-        route_after_resource,
-        {
-            "habit_support": "habit_support",
-            "end": END
-        }
-    )
+    # intake → continue intake (loop back) OR proceed to crisis
+    workflow.add_conditional_edges("intake", route_after_intake)
 
-    # support_resources → habit support or END
-    workflow.add_conditional_edges(
-        "support_resources",
-        route_after_support,
-        {
-            "habit_support": "habit_support",
-            "end": END
-        }
-    )
+    # crisis_assessment → resource matching or support resources
+    workflow.add_conditional_edges("crisis_assessment", route_after_crisis)
 
-    # Habit agent always ends the workflow
-    workflow.add_edge("habit_support", END)
+    # Both branches end the workflow - habit planning happens inside
+    # them, overlapped with the branch's own work
+    workflow.add_edge("resource_matching", END)
+    workflow.add_edge("support_resources", END)
 
-    # Compile the workflow
-    compiled_workflow = workflow.compile()
+    # Compile the workflow (optionally with a checkpointer so threads
+    # can resume mid-conversation without replaying prior turns)
+    compiled_workflow = workflow.compile(checkpointer=checkpointer)
 
     logger.info("✅ Workflow compiled successfully")
-    logger.info("   Nodes: coordinator, intake, crisis_assessment, resource_matching, support_resources, habit_support")
+    logger.info("   Nodes: coordinator, intake, crisis_assessment, resource_matching, support_resources")
     logger.info("   Routing: Coordinator-driven multi-agent flow")
 
     return compiled_workflow
@@ -534,61 +596,133 @@ def create_intake_crisis_workflow():
 # CONVENIENCE FUNCTION
 # ================================================================
 
+# Static defaults for a fresh conversation thread, built once. Each
+# run copies and overlays the per-request fields instead of re-creating
+# all the literals - small, but it's on every request.
+_INITIAL_STATE_DEFAULTS: WorkflowState = {
+    "agent_data": None,
+    "coordinator_plan": None,
+    "needs_habit_support": False,
+    "habit_plan_created": False,
+    "habit_plan": None,
+    "intake_complete": False,
+    "intake_stage": None,
+    "risk_level": None,
+    "crisis_detected": False,
+    "therapist_matched": False,
+    "matched_therapist_id": None,
+    "matched_therapist_name": None,
+    "next_step": None,
+    "workflow_complete": False
+}
+
+
+# Compiled graph singleton - the graph is immutable once compiled, so
+# rebuilding it per run_intake_workflow call was pure allocation churn
+#
+# PERFORMANCE NOTE: hand-inlining the common no-crisis path as a
+# straight-line coroutine that bypasses the graph runtime was
+# considered and rejected. Pregel dispatch costs microseconds per
+# superstep against seconds of LLM latency inside each node, and a
+# bypass would skip the per-thread checkpoint writes (conversation
+# resumption) and the astream early-exit hook for emergencies - two
+# correctness features anchored to the graph runtime. Revisit only if
+# profiling ever shows superstep dispatch in a flame graph.
+_COMPILED_WORKFLOW = None
+
+# Per-thread conversation checkpoints. MemorySaver because this
+# langgraph line's SqliteSaver is sync-only (its async methods raise)
+# and our entrypoint is ainvoke; durable cross-process resumption would
+# need the aiosqlite-backed saver from langgraph-checkpoint-sqlite.
+# In-process persistence matches how voice_api keeps its session store.
+_CHECKPOINTER = MemorySaver()
+
+
+def _get_workflow():
+    """Build the compiled workflow once and reuse it."""
+    global _COMPILED_WORKFLOW
+    if _COMPILED_WORKFLOW is None:
+        _COMPILED_WORKFLOW = create_intake_crisis_workflow(checkpointer=_CHECKPOINTER)
+    return _COMPILED_WORKFLOW
+
+
 async def run_intake_workflow(
     user_message: str,
     user_id: str = "demo_user",
-    privacy_tier: str = "full_support"
+    privacy_tier: str = "full_support",
+    thread_id: Optional[str] = None
 ):
     """
     Run the workflow with a user message.
 
-    This handles multi-turn conversations automatically!
+    This handles multi-turn conversations automatically! Turns that
+    share a thread_id (defaults to the user_id) resume from the saved
+    checkpoint, so completed intake stages and prior assessments are
+    loaded instead of re-running their LLM calls.
     """
 
-    logger.info("=" * 70)
-    logger.info("🚀 STARTING INTAKE WORKFLOW")
-    logger.info("=" * 70)
-    logger.info(f"User Message: {user_message}")
-    logger.info(f"User ID: {user_id}")
-    logger.info(f"Privacy Tier: {privacy_tier}")
-    logger.info("=" * 70)
-
-    # Create workflow
-    workflow = create_intake_crisis_workflow()
-
-    # Initialize state
-    initial_state: WorkflowState = {
-        "messages": [HumanMessage(content=user_message)],
-        "user_id": user_id,
-        "privacy_tier": privacy_tier,
-        "coordinator_plan": None,
-        "needs_habit_support": False,
-        "habit_plan_created": False,
-        "habit_plan": None,
-        "intake_complete": False,
-        "intake_stage": None,
-        "risk_level": None,
-        "crisis_detected": False,
-        "therapist_matched": False,
-        "matched_therapist_id": None,
-        "matched_therapist_name": None,
-        "next_step": None,
-        "workflow_complete": False
-    }
-
-    # Run workflow
-    final_state = await workflow.ainvoke(initial_state)
+    _log_stage("🚀 STARTING INTAKE WORKFLOW")
+    logger.info("User: {} | Tier: {} | Message: {}", user_id, privacy_tier, user_message)
+
+    # Reuse the compiled workflow - state is passed per invocation, the
+    # graph itself never changes
+    workflow = _get_workflow()
+
+    config = {"configurable": {"thread_id": thread_id or user_id}}
+    snapshot = await workflow.aget_state(config)
+
+    if snapshot.values:
+        # Resumed thread: the checkpoint already holds the conversation
+        # and intake progress, so send only this turn's delta. Passing
+        # the full initial state here would wipe intake_stage and force
+        # every completed stage's LLM call to run again.
+        turn_input: WorkflowState = {
+            "messages": [HumanMessage(content=user_message)],
+            "next_step": None,
+            "workflow_complete": False
+        }
+    else:
+        # Fresh thread: seed every channel (shared defaults + the
+        # per-request fields)
+        turn_input = dict(_INITIAL_STATE_DEFAULTS)
+        turn_input.update(
+            messages=[HumanMessage(content=user_message)],
+            user_id=user_id,
+            privacy_tier=privacy_tier,
+        )
 
-    logger.info("=" * 70)
-    logger.info("✅ WORKFLOW COMPLETE")
-    logger.info("=" * 70)
-    logger.info(f"Intake Complete: {final_state.get('intake_complete')}")
-    logger.info(f"Risk Level: {final_state.get('risk_level')}")
-    logger.info(f"Crisis Detected: {final_state.get('crisis_detected')}")
-    logger.info(f"Therapist Matched: {final_state.get('therapist_matched')}")
-    if final_state.get('matched_therapist_name'):
-        logger.info(f"Matched With: {final_state.get('matched_therapist_name')}")
-    logger.info("=" * 70)
+    # Run the workflow as a stream of node updates rather than ainvoke:
+    # streaming gives us a hook to bail out the moment the Crisis Agent
+    # flags an immediate emergency. Those turns answer from the static
+    # template instead of waiting on the resource-matching round trip -
+    # exactly the turns where every second counts.
+    async for event in workflow.astream(turn_input, config, stream_mode="updates"):
+        update = event.get("crisis_assessment")
+        if (
+            update
+            and update.get("risk_level") == "immediate"
+            and (update.get("agent_data") or {}).get("needs_emergency_services")
+        ):
+            logger.warning("🚨 Immediate risk detected - short-circuiting to emergency response")
+            await workflow.aupdate_state(config, {
+                "messages": [AIMessage(content=EMERGENCY_RESPONSE_TEMPLATE)],
+                "workflow_complete": True
+            })
+            break
+
+    # Final channel values live in the checkpoint, whether the stream
+    # ran to completion or was cut short above
+    final_state = (await workflow.aget_state(config)).values
+
+    _log_stage("✅ WORKFLOW COMPLETE")
+    logger.info(
+        "Result | intake_complete={} risk={} crisis={} matched={} therapist={}",
+        final_state.get("intake_complete"),
+        final_state.get("risk_level"),
+        final_state.get("crisis_detected"),
+        final_state.get("therapist_matched"),
+        final_state.get("matched_therapist_name"),
+    )
 
     return final_state
 
@@ -598,7 +732,6 @@ async def run_intake_workflow(
 # ================================================================
 
 if __name__ == "__main__":
-    import asyncio
 
     async def test_workflow():
         """Test the intake workflow."""